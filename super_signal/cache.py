@@ -4,12 +4,15 @@ This module provides a caching layer using SQLite in-memory database
 to minimize repeated API/HTTP requests for the same ticker.
 """
 
+import hashlib
 import json
 import logging
 import sqlite3
-import time
-from dataclasses import asdict
-from typing import Optional, List, Tuple
+import threading
+import weakref
+from pathlib import Path
+from dataclasses import fields
+from typing import Dict, Optional, List, Tuple
 
 from .models import StockInfo
 
@@ -18,6 +21,132 @@ logger = logging.getLogger("super_signal.cache")
 # Default cache TTL in seconds (1 hour)
 DEFAULT_TTL = 3600
 
+# Interval in seconds between background purges of the global cache's
+# expired rows (standalone caches run no sweeper unless asked to, and
+# otherwise purge expired rows only when opened)
+DEFAULT_SWEEP_INTERVAL = 60
+
+# Tables holding TTL-bound cache entries
+_CACHE_TABLES = ("stock_info", "adr_status", "directors")
+
+# Current Unix time (fractional seconds) evaluated inside SQLite, so no
+# timestamp has to be bound per query. unixepoch('subsec') needs SQLite
+# 3.42+; older libraries derive it from julianday().
+if sqlite3.sqlite_version_info >= (3, 42, 0):
+    _NOW_SQL = "unixepoch('subsec')"
+else:
+    _NOW_SQL = "((julianday('now') - 2440587.5) * 86400.0)"
+
+# StockInfo field names, in declaration order, for blob (de)serialization
+_STOCK_INFO_FIELDS = tuple(f.name for f in fields(StockInfo))
+
+# Write locks shared by every cache opened on the same named database
+_write_locks: Dict[str, threading.Lock] = {}
+_write_locks_guard = threading.Lock()
+
+
+def _write_lock_for(db_path: str) -> threading.Lock:
+    """Return the write lock for a database, creating it if necessary.
+
+    Private ":memory:" databases get their own lock; any other path or URI
+    shares one lock across all caches in the process that open it.
+
+    Args:
+        db_path: Database path or URI passed to StockCache
+
+    Returns:
+        Lock serializing writes to that database
+    """
+    if db_path == ":memory:":
+        return threading.Lock()
+    with _write_locks_guard:
+        return _write_locks.setdefault(db_path, threading.Lock())
+
+
+# Size of the per-connection prepared statement cache
+_CACHED_STATEMENTS = 128
+
+# SQL statements, built once so repeated calls hit the statement cache
+_SQL_GET_STOCK_INFO = (
+    f"SELECT data FROM stock_info WHERE ticker = ? AND expires_at > {_NOW_SQL}"
+)
+# Setters upsert so an overwrite updates the row in place instead of
+# deleting and reinserting it (ON CONFLICT ... DO UPDATE needs SQLite 3.24+)
+_SQL_SET_STOCK_INFO = (
+    "INSERT INTO stock_info (ticker, data, expires_at) "
+    f"VALUES (?, ?, {_NOW_SQL} + ?) "
+    "ON CONFLICT (ticker) DO UPDATE SET "
+    "data = excluded.data, expires_at = excluded.expires_at"
+)
+_SQL_DELETE_STOCK_INFO = "DELETE FROM stock_info WHERE ticker = ?"
+_SQL_GET_ADR_STATUS = (
+    f"SELECT is_adr FROM adr_status WHERE ticker = ? AND expires_at > {_NOW_SQL}"
+)
+_SQL_SET_ADR_STATUS = (
+    "INSERT INTO adr_status (ticker, is_adr, expires_at) "
+    f"VALUES (?, ?, {_NOW_SQL} + ?) "
+    "ON CONFLICT (ticker) DO UPDATE SET "
+    "is_adr = excluded.is_adr, expires_at = excluded.expires_at"
+)
+# The directors row marks a live entry (even for an empty list); the LEFT
+# JOIN yields a single NULL name in that case
+_SQL_GET_DIRECTORS = (
+    "SELECT i.name FROM directors d "
+    "LEFT JOIN directors_items i ON i.ticker = d.ticker "
+    f"WHERE d.ticker = ? AND d.expires_at > {_NOW_SQL} "
+    "ORDER BY i.idx"
+)
+_SQL_GET_DIRECTORS_HASH = (
+    f"SELECT dir_hash FROM directors WHERE ticker = ? AND expires_at > {_NOW_SQL}"
+)
+_SQL_SET_DIRECTORS = (
+    "INSERT INTO directors (ticker, dir_hash, expires_at) "
+    f"VALUES (?, ?, {_NOW_SQL} + ?) "
+    "ON CONFLICT (ticker) DO UPDATE SET "
+    "dir_hash = excluded.dir_hash, expires_at = excluded.expires_at"
+)
+_SQL_DELETE_DIRECTORS_ITEMS = "DELETE FROM directors_items WHERE ticker = ?"
+_SQL_INSERT_DIRECTORS_ITEM = (
+    "INSERT INTO directors_items (ticker, idx, name) VALUES (?, ?, ?)"
+)
+_SQL_PURGE_EXPIRED = tuple(
+    f"DELETE FROM {table} WHERE expires_at <= {_NOW_SQL}"
+    for table in _CACHE_TABLES
+)
+_SQL_PURGE_ORPHAN_DIRECTORS_ITEMS = (
+    "DELETE FROM directors_items "
+    "WHERE ticker NOT IN (SELECT ticker FROM directors)"
+)
+
+
+def _directors_hash(directors: List[str]) -> bytes:
+    """Compute a canonical digest of a directors list.
+
+    Each name is length-prefixed so that different lists can never encode
+    to the same byte stream.
+
+    Args:
+        directors: List of director names/titles, in display order
+
+    Returns:
+        16-byte BLAKE2b digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name in directors:
+        encoded = name.encode("utf-8")
+        digest.update(len(encoded).to_bytes(4, "little"))
+        digest.update(encoded)
+    return digest.digest()
+
+
+# Connection tuning applied when StockCache is created with fast=True
+_FAST_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+)
+
 
 class StockCache:
     """In-memory SQLite cache for stock data.
@@ -26,62 +155,164 @@ class StockCache:
     network requests for the same ticker within a session.
     """
 
-    def __init__(self, ttl: int = DEFAULT_TTL):
-        """Initialize the in-memory cache.
+    def __init__(
+        self,
+        ttl: int = DEFAULT_TTL,
+        db_path: str = ":memory:",
+        fast: bool = True,
+        sweep_interval: Optional[float] = None
+    ):
+        """Initialize the cache.
 
         Args:
             ttl: Time-to-live for cache entries in seconds (default: 1 hour)
+            db_path: SQLite database path (default: private in-memory
+                database). A "file:...?mode=memory&cache=shared" URI opens
+                a named in-memory database shared with other caches; any
+                other "file:" URI is used as given.
+            fast: Apply tuned PRAGMAs (WAL for file databases, relaxed
+                syncing, in-memory temp store, larger page cache)
+            sweep_interval: Seconds between background purges of expired
+                rows, or None (default) to run no sweeper thread. Expired
+                rows are always purged once when the cache is opened, so a
+                file database left by an earlier run does not keep them.
         """
         self.ttl = ttl
-        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
-        self._create_tables()
-        logger.info("Initialized in-memory stock cache")
+        self.db_path = db_path
+        self._is_memory = db_path == ":memory:" or "mode=memory" in db_path
+        self._lock = _write_lock_for(db_path)
+        self._closed = False
+        self._sweeper: Optional[threading.Timer] = None
+        self._sweep_interval = sweep_interval
+
+        # Writes go through self.conn. File databases also get a read-only
+        # connection so lookups read the last committed snapshot without
+        # queueing behind the writer. In-memory databases have no WAL, so
+        # their reads go through self.conn under the write lock; a reader
+        # must never see a multi-statement write before it commits.
+        if db_path == ":memory:" or db_path.startswith("file:"):
+            # Private in-memory database, or a URI (such as a named
+            # shared-cache memory database) passed through unchanged
+            rw_uri = db_path
+        else:
+            rw_uri = Path(db_path).absolute().as_uri()
+
+        self.conn = self._connect(rw_uri)
+        if fast:
+            self._apply_pragmas(self.conn, journal=True)
+        with self._lock:
+            self._create_tables()
+        self.purge_expired()
+
+        self._ro: Optional[sqlite3.Connection] = None
+        if not self._is_memory:
+            # A later mode= parameter overrides any earlier one in the URI
+            separator = "&" if "?" in rw_uri else "?"
+            self._ro = self._connect(f"{rw_uri}{separator}mode=ro")
+            if fast:
+                self._apply_pragmas(self._ro)
+
+        if sweep_interval:
+            self._schedule_sweep()
+        logger.info(f"Initialized stock cache ({db_path})")
+
+    @staticmethod
+    def _connect(uri: str) -> sqlite3.Connection:
+        """Open a connection to the cache database.
+
+        Args:
+            uri: SQLite URI filename
+
+        Returns:
+            Open SQLite connection usable from any thread
+        """
+        return sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS
+        )
+
+    def _apply_pragmas(self, conn: sqlite3.Connection, journal: bool = False) -> None:
+        """Apply performance PRAGMAs to a connection.
+
+        Args:
+            conn: Connection to tune
+            journal: Also switch file databases to WAL journaling
+        """
+        # WAL is not supported for in-memory databases
+        if journal and not self._is_memory:
+            conn.execute("PRAGMA journal_mode=WAL")
+        for pragma in _FAST_PRAGMAS:
+            conn.execute(pragma)
+        logger.debug("Cache PRAGMAs applied")
+
+    def _read(self, sql: str, params: Tuple) -> List[Tuple]:
+        """Run a lookup query and return all of its rows.
+
+        Each lookup is a single statement, so it sees one committed state:
+        a WAL snapshot on the read-only connection for file databases, or
+        the writer's connection under the write lock for in-memory ones.
+
+        Args:
+            sql: SELECT statement
+            params: Query parameters
+
+        Returns:
+            List of result rows
+        """
+        if self._ro is not None:
+            return self._ro.execute(sql, params).fetchall()
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
 
     def _create_tables(self) -> None:
         """Create the cache tables."""
         cursor = self.conn.cursor()
 
-        # Stock info cache
+        # Stock info cache (kept as a rowid table since its blobs are large)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS stock_info (
-                ticker TEXT PRIMARY KEY,
-                data TEXT NOT NULL,
-                cached_at REAL NOT NULL
+                ticker TEXT PRIMARY KEY COLLATE NOCASE,
+                data BLOB NOT NULL,
+                expires_at REAL NOT NULL
             )
         """)
 
+        # The remaining tables have small rows, so they are stored WITHOUT
+        # ROWID: the primary key B-tree holds every column and lookups are
+        # a single index-only search
+
         # ADR status cache (from FinViz)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS adr_status (
-                ticker TEXT PRIMARY KEY,
+                ticker TEXT PRIMARY KEY COLLATE NOCASE,
                 is_adr INTEGER,
-                cached_at REAL NOT NULL
-            )
+                expires_at REAL NOT NULL
+            ) WITHOUT ROWID
         """)
 
-        # Directors cache
+        # Directors cache: one row per ticker holds the expiry, and
+        # directors_items holds one row per director in display order
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS directors (
-                ticker TEXT PRIMARY KEY,
-                directors TEXT NOT NULL,
-                cached_at REAL NOT NULL
-            )
+                ticker TEXT PRIMARY KEY COLLATE NOCASE,
+                dir_hash BLOB NOT NULL,
+                expires_at REAL NOT NULL
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS directors_items (
+                ticker TEXT NOT NULL COLLATE NOCASE,
+                idx INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                PRIMARY KEY (ticker, idx)
+            ) WITHOUT ROWID
         """)
 
         self.conn.commit()
         logger.debug("Cache tables created")
 
-    def _is_expired(self, cached_at: float) -> bool:
-        """Check if a cache entry has expired.
-
-        Args:
-            cached_at: Unix timestamp when the entry was cached
-
-        Returns:
-            True if expired, False otherwise
-        """
-        return time.time() - cached_at > self.ttl
-
     def get_stock_info(self, ticker: str) -> Optional[StockInfo]:
         """Retrieve cached stock info for a ticker.
 
@@ -91,26 +322,23 @@ class StockCache:
         Returns:
             StockInfo if cached and not expired, None otherwise
         """
-        ticker = ticker.upper()
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT data, cached_at FROM stock_info WHERE ticker = ?",
-            (ticker,)
-        )
-        row = cursor.fetchone()
+        rows = self._read(_SQL_GET_STOCK_INFO, (ticker,))
 
-        if row is None:
+        if not rows:
             logger.debug(f"Cache miss for stock_info: {ticker}")
             return None
 
-        data, cached_at = row
-        if self._is_expired(cached_at):
-            logger.debug(f"Cache expired for stock_info: {ticker}")
-            self._delete_stock_info(ticker)
+        try:
+            stock_info = self._deserialize_stock_info(rows[0][0])
+        except (ValueError, TypeError) as e:
+            # Corrupt JSON or a payload that no longer fits StockInfo
+            logger.warning(f"Discarding unreadable stock_info for {ticker}: {e}")
+            with self._lock, self.conn:
+                self.conn.execute(_SQL_DELETE_STOCK_INFO, (ticker,))
             return None
 
         logger.info(f"Cache hit for stock_info: {ticker}")
-        return self._deserialize_stock_info(data)
+        return stock_info
 
     def set_stock_info(self, stock_info: StockInfo) -> None:
         """Cache stock info for a ticker.
@@ -118,35 +346,33 @@ class StockCache:
         Args:
             stock_info: StockInfo object to cache
         """
-        ticker = stock_info.ticker.upper()
-        data = self._serialize_stock_info(stock_info)
-        cached_at = time.time()
+        self.set_stock_info_many([stock_info])
 
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO stock_info (ticker, data, cached_at)
-            VALUES (?, ?, ?)
-            """,
-            (ticker, data, cached_at)
-        )
-        self.conn.commit()
-        logger.debug(f"Cached stock_info for {ticker}")
+    def set_stock_info_many(self, stock_infos: List[StockInfo]) -> None:
+        """Cache stock info for several tickers in a single transaction.
 
-    def _delete_stock_info(self, ticker: str) -> None:
-        """Delete cached stock info for a ticker."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM stock_info WHERE ticker = ?", (ticker,))
-        self.conn.commit()
-
-    def _serialize_stock_info(self, stock_info: StockInfo) -> str:
-        """Serialize StockInfo to JSON string."""
-        return json.dumps(asdict(stock_info))
-
-    def _deserialize_stock_info(self, data: str) -> StockInfo:
-        """Deserialize JSON string to StockInfo."""
-        d = json.loads(data)
-        return StockInfo(**d)
+        Args:
+            stock_infos: StockInfo objects to cache
+        """
+        rows = [
+            (info.ticker, self._serialize_stock_info(info), self.ttl)
+            for info in stock_infos
+        ]
+
+        with self._lock, self.conn:
+            self.conn.executemany(_SQL_SET_STOCK_INFO, rows)
+        logger.debug(f"Cached stock_info for {len(rows)} ticker(s)")
+
+    def _serialize_stock_info(self, stock_info: StockInfo) -> bytes:
+        """Serialize StockInfo to a JSON-encoded blob."""
+        return json.dumps(
+            {name: getattr(stock_info, name) for name in _STOCK_INFO_FIELDS},
+            separators=(",", ":"),
+        ).encode()
+
+    def _deserialize_stock_info(self, data: bytes) -> StockInfo:
+        """Deserialize a JSON-encoded blob to StockInfo."""
+        return StockInfo(**json.loads(data))
 
     def get_adr_status(self, ticker: str) -> Tuple[Optional[bool], bool]:
         """Retrieve cached ADR status for a ticker.
@@ -158,23 +384,13 @@ class StockCache:
             Tuple of (is_adr, cache_hit). is_adr is None if not in cache
             or if FinViz returned None. cache_hit is True if found in cache.
         """
-        ticker = ticker.upper()
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT is_adr, cached_at FROM adr_status WHERE ticker = ?",
-            (ticker,)
-        )
-        row = cursor.fetchone()
+        rows = self._read(_SQL_GET_ADR_STATUS, (ticker,))
 
-        if row is None:
+        if not rows:
             logger.debug(f"Cache miss for adr_status: {ticker}")
             return None, False
 
-        is_adr_int, cached_at = row
-        if self._is_expired(cached_at):
-            logger.debug(f"Cache expired for adr_status: {ticker}")
-            self._delete_adr_status(ticker)
-            return None, False
+        is_adr_int = rows[0][0]
 
         # Convert from integer (0, 1, or NULL) back to Optional[bool]
         is_adr = None if is_adr_int is None else bool(is_adr_int)
@@ -188,28 +404,15 @@ class StockCache:
             ticker: Stock ticker symbol
             is_adr: ADR status (True, False, or None if unknown)
         """
-        ticker = ticker.upper()
         # Convert Optional[bool] to integer for SQLite
         is_adr_int = None if is_adr is None else int(is_adr)
-        cached_at = time.time()
 
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO adr_status (ticker, is_adr, cached_at)
-            VALUES (?, ?, ?)
-            """,
-            (ticker, is_adr_int, cached_at)
-        )
-        self.conn.commit()
+        with self._lock, self.conn:
+            self.conn.execute(
+                _SQL_SET_ADR_STATUS, (ticker, is_adr_int, self.ttl)
+            )
         logger.debug(f"Cached adr_status for {ticker}: {is_adr}")
 
-    def _delete_adr_status(self, ticker: str) -> None:
-        """Delete cached ADR status for a ticker."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM adr_status WHERE ticker = ?", (ticker,))
-        self.conn.commit()
-
     def get_directors(self, ticker: str) -> Tuple[Optional[List[str]], bool]:
         """Retrieve cached directors for a ticker.
 
@@ -220,26 +423,29 @@ class StockCache:
             Tuple of (directors_list, cache_hit). directors_list is None
             if not in cache. cache_hit is True if found in cache.
         """
-        ticker = ticker.upper()
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT directors, cached_at FROM directors WHERE ticker = ?",
-            (ticker,)
-        )
-        row = cursor.fetchone()
+        rows = self._read(_SQL_GET_DIRECTORS, (ticker,))
 
-        if row is None:
+        if not rows:
             logger.debug(f"Cache miss for directors: {ticker}")
             return None, False
 
-        directors_json, cached_at = row
-        if self._is_expired(cached_at):
-            logger.debug(f"Cache expired for directors: {ticker}")
-            self._delete_directors(ticker)
-            return None, False
-
         logger.info(f"Cache hit for directors: {ticker}")
-        return json.loads(directors_json), True
+        return [name for (name,) in rows if name is not None], True
+
+    def get_directors_hash(self, ticker: str) -> Optional[bytes]:
+        """Retrieve the digest of a ticker's cached directors list.
+
+        Lets callers check whether a directors list changed without
+        loading it.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            Digest of the cached list if cached and not expired, None otherwise
+        """
+        rows = self._read(_SQL_GET_DIRECTORS_HASH, (ticker,))
+        return rows[0][0] if rows else None
 
     def set_directors(self, ticker: str, directors: List[str]) -> None:
         """Cache directors for a ticker.
@@ -248,60 +454,156 @@ class StockCache:
             ticker: Stock ticker symbol
             directors: List of director names/titles
         """
-        ticker = ticker.upper()
-        directors_json = json.dumps(directors)
-        cached_at = time.time()
+        self.set_directors_many([(ticker, directors)])
 
-        cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO directors (ticker, directors, cached_at)
-            VALUES (?, ?, ?)
-            """,
-            (ticker, directors_json, cached_at)
-        )
-        self.conn.commit()
-        logger.debug(f"Cached {len(directors)} directors for {ticker}")
+    def set_directors_many(self, pairs: List[Tuple[str, List[str]]]) -> None:
+        """Cache directors for several tickers in a single transaction.
 
-    def _delete_directors(self, ticker: str) -> None:
-        """Delete cached directors for a ticker."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM directors WHERE ticker = ?", (ticker,))
-        self.conn.commit()
+        Args:
+            pairs: (ticker, directors) tuples to cache
+        """
+        # Last entry wins when a ticker appears more than once (any case)
+        latest = {ticker.upper(): (ticker, directors) for ticker, directors in pairs}
+        tickers = [(ticker,) for ticker, _ in latest.values()]
+        items = [
+            (ticker, idx, name)
+            for ticker, directors in latest.values()
+            for idx, name in enumerate(directors)
+        ]
+
+        with self._lock, self.conn:
+            self.conn.executemany(_SQL_DELETE_DIRECTORS_ITEMS, tickers)
+            self.conn.executemany(
+                _SQL_SET_DIRECTORS,
+                [
+                    (ticker, _directors_hash(directors), self.ttl)
+                    for ticker, directors in latest.values()
+                ]
+            )
+            self.conn.executemany(_SQL_INSERT_DIRECTORS_ITEM, items)
+        logger.debug(f"Cached directors for {len(tickers)} ticker(s)")
 
-    def clear(self) -> None:
-        """Clear all cached data."""
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM stock_info")
-        cursor.execute("DELETE FROM adr_status")
-        cursor.execute("DELETE FROM directors")
-        self.conn.commit()
+    def purge_expired(self) -> int:
+        """Delete all expired entries from every cache table.
+
+        Returns:
+            Number of rows deleted
+        """
+        deleted = 0
+        with self._lock, self.conn:
+            for sql in _SQL_PURGE_EXPIRED:
+                deleted += self.conn.execute(sql).rowcount
+            if deleted:
+                self.conn.execute(_SQL_PURGE_ORPHAN_DIRECTORS_ITEMS)
+        if deleted:
+            logger.debug(f"Purged {deleted} expired cache entries")
+        return deleted
+
+    def _schedule_sweep(self) -> None:
+        """Schedule the next background purge of expired entries."""
+        self._sweeper = threading.Timer(self._sweep_interval, self._sweep)
+        self._sweeper.daemon = True
+        self._sweeper.start()
+
+    def _sweep(self) -> None:
+        """Purge expired entries, then reschedule unless the cache is closed.
+
+        Safe to call directly on a cache without a sweeper; it then purges
+        once and schedules nothing.
+        """
+        if self._closed:
+            return
+        try:
+            self.purge_expired()
+        except sqlite3.Error:
+            # close() may race with a sweep that is already running
+            if not self._closed:
+                logger.exception("Background cache sweep failed")
+        if self._sweep_interval and not self._closed:
+            self._schedule_sweep()
+
+    def clear(self, vacuum: bool = False) -> None:
+        """Clear all cached data.
+
+        Each table is emptied with a bare DELETE (no WHERE clause) in one
+        transaction so SQLite can apply its truncate optimization.
+
+        Args:
+            vacuum: Also run VACUUM afterwards to release freed pages
+        """
+        with self._lock:
+            with self.conn:
+                self.conn.execute("DELETE FROM stock_info")
+                self.conn.execute("DELETE FROM adr_status")
+                self.conn.execute("DELETE FROM directors")
+                self.conn.execute("DELETE FROM directors_items")
+            if vacuum:
+                # VACUUM cannot run inside a transaction
+                self.conn.execute("VACUUM")
         logger.info("Cache cleared")
 
     def close(self) -> None:
-        """Close the database connection."""
-        self.conn.close()
-        logger.debug("Cache connection closed")
+        """Stop the background sweeper and close the database connections."""
+        self._closed = True
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        with self._lock:
+            if self._ro is not None:
+                self._ro.close()
+            self.conn.close()
+        logger.debug("Cache connections closed")
+
+
+# Named in-memory database shared by every thread's global cache
+_GLOBAL_DB_URI = "file:super_signal_cache_global?mode=memory&cache=shared"
 
+# Per-thread global cache instances (initialized lazily). Each thread gets
+# its own connections rather than sharing one across threads, but every
+# instance serializes its reads and writes on the database's shared lock,
+# so this gives no extra concurrency over a single instance.
+_cache_tls = threading.local()
 
-# Global cache instance (initialized lazily)
-_cache: Optional[StockCache] = None
+# Instance that keeps the shared database alive (a shared-cache memory
+# database is dropped when its last connection closes) and runs the sweeper
+_global_cache: Optional[StockCache] = None
+_global_cache_lock = threading.Lock()
+
+
+class _ThreadExitHook:
+    """Marker kept in a thread-local; it is released when its thread exits."""
+
+    __slots__ = ("__weakref__",)
 
 
 def get_cache() -> StockCache:
-    """Get the global cache instance, creating it if necessary.
+    """Get the current thread's global cache instance, creating it if necessary.
+
+    All instances share one named in-memory database, so data cached by one
+    thread is visible to the others. Each instance is closed when the thread
+    that created it exits.
 
     Returns:
-        The global StockCache instance
+        The StockCache instance for the calling thread
     """
-    global _cache
-    if _cache is None:
-        _cache = StockCache()
-    return _cache
+    global _global_cache
+    cache = getattr(_cache_tls, "instance", None)
+    if cache is None:
+        with _global_cache_lock:
+            if _global_cache is None:
+                _global_cache = StockCache(
+                    db_path=_GLOBAL_DB_URI, sweep_interval=DEFAULT_SWEEP_INTERVAL
+                )
+        cache = StockCache(db_path=_GLOBAL_DB_URI)
+        _cache_tls.instance = cache
+        _cache_tls.exit_hook = _ThreadExitHook()
+        weakref.finalize(_cache_tls.exit_hook, cache.close)
+    return cache
 
 
 def clear_cache() -> None:
-    """Clear the global cache."""
-    global _cache
-    if _cache is not None:
-        _cache.clear()
+    """Clear the global cache (shared by all threads).
+
+    Does nothing if no global cache has been created yet.
+    """
+    if _global_cache is not None:
+        _global_cache.clear()
@@ -15,7 +15,7 @@ from .fetchers.yahoo_finance import fetch_stock_info, fetch_vix, is_adr_yahoo
 from .fetchers.finviz import determine_adr_status, get_directors
 from .analyzers import analyze_stock_risks
 from .formatters.display import print_stock_summary
-from .formatters import get_formatter
+from .formatters import get_formatter, TextFormatter
 from .config import ANSIColor, RED_FLAGS, DISPLAY_CONFIG
 from .models import StockInfo, RiskAnalysis
 
@@ -60,15 +60,63 @@ def normalize_tickers(ticker_args: List[str]) -> List[str]:
         >>> normalize_tickers(["AAPL", "AAPL,GOOG"])
         ['AAPL', 'GOOG']
     """
-    seen = set()
-    result = []
-    for arg in ticker_args:
-        for ticker in arg.split(","):
-            ticker = ticker.strip().upper()
-            if ticker and ticker not in seen:
-                seen.add(ticker)
-                result.append(ticker)
-    return result
+    # dict.fromkeys dedupes while keeping first-occurrence order
+    return list(dict.fromkeys(
+        ticker
+        for arg in ticker_args
+        for raw in arg.split(",")
+        if (ticker := raw.strip().upper())
+    ))
+
+
+def _stdout_is_tty() -> bool:
+    """Check whether stdout is attached to a terminal."""
+    isatty = getattr(sys.stdout, "isatty", None)
+    return bool(isatty and isatty())
+
+
+def use_color(color: str = "auto") -> bool:
+    """Decide whether text output should keep its ANSI colors.
+
+    Args:
+        color: Color mode ('auto', 'always', or 'never'). 'auto' keeps colors
+            only when stdout is a terminal.
+
+    Returns:
+        True if ANSI colors should be emitted, False otherwise
+    """
+    if color == "always":
+        return True
+    if color == "never":
+        return False
+    return _stdout_is_tty()
+
+
+def emit_output(output: str, output_format: str, color: str = "auto") -> None:
+    """Print formatted output, stripping ANSI codes from uncolored text.
+
+    When stdout is a pipe or file, the whole output is encoded once and
+    written to the underlying binary buffer, bypassing the text layer.
+    Newlines are written as "\n" unchanged.
+
+    Args:
+        output: Formatted output string
+        output_format: Output format the string was produced with
+        color: Color mode ('auto', 'always', or 'never')
+    """
+    if output_format == "text" and not use_color(color):
+        output = TextFormatter.strip_ansi(output)
+
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None or _stdout_is_tty():
+        print(output)
+        return
+
+    sys.stdout.flush()
+    encoding = sys.stdout.encoding or "utf-8"
+    errors = getattr(sys.stdout, "errors", None) or "strict"
+    buffer.write((output + "\n").encode(encoding, errors))
+    buffer.flush()
 
 
 def clear_screen() -> None:
@@ -86,12 +134,17 @@ def set_console_title(title: str) -> None:
         os.system(f"title {title}")
 
 
-def run_for_ticker(ticker_symbol: str, output_format: str = "text") -> bool:
+def run_for_ticker(
+    ticker_symbol: str,
+    output_format: str = "text",
+    color: str = "auto"
+) -> bool:
     """Run stock screening for a single ticker.
 
     Args:
         ticker_symbol: Stock ticker symbol to screen
         output_format: Output format ('text', 'json', or 'csv')
+        color: Color mode for text output ('auto', 'always', or 'never')
 
     Returns:
         True if successful, False if an error occurred
@@ -139,7 +192,7 @@ def run_for_ticker(ticker_symbol: str, output_format: str = "text") -> bool:
             RED_FLAGS.min_free_float,
             vix_value
         )
-        print(output)
+        emit_output(output, output_format, color)
 
         logger.info(f"Successfully completed screening for {ticker_symbol}")
         return True
@@ -211,7 +264,8 @@ def fetch_ticker_data(ticker_symbol: str) -> TickerResult:
 def run_for_tickers(
     tickers: List[str],
     output_format: str = "text",
-    max_workers: int = 10
+    max_workers: int = 10,
+    color: str = "auto"
 ) -> bool:
     """Run stock screening for multiple tickers.
 
@@ -219,6 +273,7 @@ def run_for_tickers(
         tickers: List of stock ticker symbols to screen
         output_format: Output format ('text', 'json', or 'csv')
         max_workers: Maximum number of concurrent fetches
+        color: Color mode for text output ('auto', 'always', or 'never')
 
     Returns:
         True if at least one ticker succeeded, False if all failed
@@ -229,7 +284,9 @@ def run_for_tickers(
 
     # For single ticker, use original behavior for backward compatibility
     if len(tickers) == 1:
-        return run_for_ticker(tickers[0], output_format=output_format)
+        return run_for_ticker(
+            tickers[0], output_format=output_format, color=color
+        )
 
     try:
         logger.info(f"Starting batch screening for {len(tickers)} tickers")
@@ -268,7 +325,7 @@ def run_for_tickers(
             RED_FLAGS.min_free_float,
             vix_value
         )
-        print(output)
+        emit_output(output, output_format, color)
 
         # Return True if at least one ticker succeeded
         successes = sum(1 for r in results if r.success)
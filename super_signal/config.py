@@ -8,6 +8,7 @@ import logging
 import sys
 from enum import Enum
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import List
 
 
@@ -74,11 +75,38 @@ class ANSIColor(Enum):
 
 # --- Display Configuration ---
 
+# Encoding names (as reported by streams) that can always encode "─"
+_UTF_ENCODINGS = frozenset({
+    "utf-8", "utf8", "utf_8", "utf-8-sig", "utf_8_sig",
+    "utf-16", "utf16", "utf_16", "utf-32", "utf32", "utf_32",
+})
+
+
+@lru_cache(maxsize=None)
+def _horizontal_line_for(encoding: str) -> str:
+    """Pick the horizontal line character for an encoding (memoized).
+
+    Args:
+        encoding: Output stream encoding name
+
+    Returns:
+        Horizontal line character (either "─" or "-")
+    """
+    try:
+        # Try to encode the Unicode box-drawing character
+        "─".encode(encoding)
+        return "─"
+    except (UnicodeEncodeError, LookupError):
+        # Fallback to ASCII hyphen if Unicode isn't supported
+        return "-"
+
+
 def _get_safe_horizontal_line() -> str:
     """Get a horizontal line character safe for the terminal encoding.
 
     Returns Unicode box-drawing character if the terminal supports it,
-    otherwise returns ASCII hyphen as fallback.
+    otherwise returns ASCII hyphen as fallback. UTF encodings are matched
+    by name; any other encoding is probed once and the result memoized.
 
     Returns:
         Horizontal line character (either "─" or "-")
@@ -86,15 +114,12 @@ def _get_safe_horizontal_line() -> str:
     try:
         # Check if stdout encoding supports Unicode
         encoding = sys.stdout.encoding or 'ascii'
-
-        # Try to encode the Unicode box-drawing character
-        test_char = "─"
-        test_char.encode(encoding)
-
-        return test_char
-    except (UnicodeEncodeError, LookupError, AttributeError):
-        # Fallback to ASCII hyphen if Unicode isn't supported
+    except AttributeError:
         return "-"
+    if encoding.lower() in _UTF_ENCODINGS:
+        return "─"
+    # Non-UTF code pages (e.g. cp437) may still have box-drawing characters
+    return _horizontal_line_for(encoding)
 
 
 @dataclass
@@ -107,12 +132,21 @@ class DisplayConfig:
         max_field_width: Maximum width for field values before wrapping
         horizontal_line: Character used for horizontal lines
         directors_max_count: Maximum number of directors to display
+        horizontal_rule: Full-width horizontal line (derived, not settable)
+        separator_rule: Full-width "=" rule between batch results (derived)
     """
     summary_width: int = 70
     label_width: int = 20
     max_field_width: int = 40
     horizontal_line: str = field(default_factory=_get_safe_horizontal_line)
     directors_max_count: int = 10
+    horizontal_rule: str = field(init=False, repr=False)
+    separator_rule: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the full-width rules used by every formatted summary."""
+        self.horizontal_rule = self.horizontal_line * self.summary_width
+        self.separator_rule = "=" * self.summary_width
 
 
 # Default display configuration
@@ -5,7 +5,8 @@ a factory function to get the appropriate formatter.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, TYPE_CHECKING
+from functools import lru_cache
+from typing import Callable, Optional, List, TYPE_CHECKING
 
 from ..models import StockInfo, RiskAnalysis
 
@@ -60,19 +61,57 @@ class BaseFormatter(ABC):
         Returns:
             Formatted string output for all results
         """
-        outputs = []
-        for result in results:
-            if result.success:
-                outputs.append(self.format(
-                    result.stock_info,
-                    result.risk_analysis,
-                    float_threshold,
-                    vix_value
-                ))
-            else:
-                outputs.append(self.format_error(result.ticker, result.error))
+        outputs = self._format_results(results, float_threshold, vix_value)
         return "\n".join(outputs)
 
+    def _format_for(self, vix_value: Optional[float]) -> Callable[..., str]:
+        """Return the single-result format callable to use for a batch.
+
+        Subclasses can return a method specialized for the given VIX value
+        so the choice is made once per batch instead of once per ticker.
+
+        Args:
+            vix_value: Current VIX index value (optional)
+
+        Returns:
+            Callable with the same signature as format()
+        """
+        return self.format
+
+    def _format_results(
+        self,
+        results: List["TickerResult"],
+        float_threshold: int,
+        vix_value: Optional[float] = None
+    ) -> List[str]:
+        """Format each result, preserving the original order.
+
+        Results are partitioned into successes and errors up front so each
+        group is formatted in its own loop without per-item branching.
+
+        Args:
+            results: List of TickerResult objects
+            float_threshold: Minimum float threshold for risk highlighting
+            vix_value: Current VIX index value (optional)
+
+        Returns:
+            List of formatted strings, one per result, in input order
+        """
+        fmt = self._format_for(vix_value)
+        ok = [i for i, r in enumerate(results) if r.success]
+        failed = [i for i, r in enumerate(results) if not r.success]
+
+        outputs: List[str] = [""] * len(results)
+        for i in ok:
+            r = results[i]
+            outputs[i] = fmt(
+                r.stock_info, r.risk_analysis, float_threshold, vix_value
+            )
+        for i in failed:
+            r = results[i]
+            outputs[i] = self.format_error(r.ticker, r.error)
+        return outputs
+
     def format_error(self, ticker: str, error: Optional[str]) -> str:
         """Format an error result for a ticker.
 
@@ -86,9 +125,13 @@ class BaseFormatter(ABC):
         return f"Error for {ticker}: {error or 'Unknown error'}"
 
 
+@lru_cache(maxsize=8)
 def get_formatter(format_type: str) -> BaseFormatter:
     """Factory function to get the appropriate formatter.
 
+    Formatters hold no state, so one shared instance is returned per
+    format type.
+
     Args:
         format_type: Output format type ('text', 'json', or 'csv')
 
@@ -7,7 +7,7 @@ suitable for importing into spreadsheets and data analysis tools.
 import csv
 import io
 import datetime
-from typing import Optional, List, Any, TYPE_CHECKING
+from typing import Any, Callable, List, Optional, Tuple, TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 from .base import BaseFormatter
@@ -66,6 +66,14 @@ class CsvFormatter(BaseFormatter):
         ("timestamp", lambda s, r, v: CsvFormatter._get_timestamp()),
     ]
 
+    # Header rows and column getters, derived once from COLUMNS
+    HEADERS: Tuple[str, ...] = tuple(col[0] for col in COLUMNS)
+    BATCH_HEADERS: Tuple[str, ...] = HEADERS + ("error",)
+    _GETTERS: Tuple[Callable[..., Any], ...] = tuple(col[1] for col in COLUMNS)
+
+    # Blank cells between the ticker and error columns of a failed row
+    _FAILED_ROW_PADDING: Tuple[str, ...] = ("",) * (len(COLUMNS) - 1)
+
     def format(
         self,
         stock_info: StockInfo,
@@ -86,19 +94,31 @@ class CsvFormatter(BaseFormatter):
         """
         output = io.StringIO()
         writer = csv.writer(output)
+        writer.writerow(self.HEADERS)
+        writer.writerow(self._row_values(stock_info, risk_analysis, vix_value))
+        return output.getvalue().rstrip('\r\n')
 
-        # Write header row
-        headers = [col[0] for col in self.COLUMNS]
-        writer.writerow(headers)
+    def _row_values(
+        self,
+        stock_info: StockInfo,
+        risk_analysis: RiskAnalysis,
+        vix_value: Optional[float]
+    ) -> List[str]:
+        """Build the formatted cell values for one stock.
 
-        # Write data row
-        values = [
-            self._format_value(col[1](stock_info, risk_analysis, vix_value))
-            for col in self.COLUMNS
-        ]
-        writer.writerow(values)
+        Args:
+            stock_info: Stock information data
+            risk_analysis: Risk analysis results
+            vix_value: Current VIX index value (optional)
 
-        return output.getvalue().rstrip('\r\n')
+        Returns:
+            One formatted value per entry in COLUMNS
+        """
+        fmt = self._format_value
+        return [
+            fmt(getter(stock_info, risk_analysis, vix_value))
+            for getter in self._GETTERS
+        ]
 
     @staticmethod
     def _format_value(value: Any) -> str:
@@ -177,25 +197,38 @@ class CsvFormatter(BaseFormatter):
         output = io.StringIO()
         writer = csv.writer(output)
 
-        # Write header row with error column added at the end
-        headers = [col[0] for col in self.COLUMNS] + ["error"]
-        writer.writerow(headers)
-
-        # Write data rows
-        for result in results:
-            if result.success:
-                values = [
-                    self._format_value(col[1](
-                        result.stock_info, result.risk_analysis, vix_value
-                    ))
-                    for col in self.COLUMNS
-                ]
-                values.append("")  # No error
-            else:
-                # For failed tickers, fill with ticker and empty values
-                values = [result.ticker]  # ticker column
-                values.extend([""] * (len(self.COLUMNS) - 1))  # other columns
-                values.append(result.error or "Unknown error")  # error column
-            writer.writerow(values)
+        # Single header row with the error column added at the end
+        writer.writerow(self.BATCH_HEADERS)
+        writer.writerows(
+            self._batch_row_values(result, vix_value) for result in results
+        )
 
         return output.getvalue().rstrip('\r\n')
+
+    def _batch_row_values(
+        self,
+        result: "TickerResult",
+        vix_value: Optional[float]
+    ) -> List[str]:
+        """Build the batch CSV cell values for one ticker result.
+
+        Args:
+            result: TickerResult to format
+            vix_value: Current VIX index value (optional)
+
+        Returns:
+            Values for every column plus the trailing error column
+        """
+        if result.success:
+            values = self._row_values(
+                result.stock_info, result.risk_analysis, vix_value
+            )
+            values.append("")  # No error
+            return values
+
+        # Failed tickers keep only the ticker and the error message
+        return [
+            result.ticker,
+            *self._FAILED_ROW_PADDING,
+            result.error or "Unknown error",
+        ]
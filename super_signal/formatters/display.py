@@ -196,7 +196,7 @@ def format_header(ticker: str) -> str:
         Formatted header string
     """
     width = DISPLAY_CONFIG.summary_width
-    line = DISPLAY_CONFIG.horizontal_line * width
+    line = DISPLAY_CONFIG.horizontal_rule
 
     title = f" - {ANSIColor.NEGATIVE.value}{ticker}{ANSIColor.RESET.value} - "
     centered_title = title.center(width)
@@ -537,7 +537,7 @@ def print_stock_summary(
         print(f"{FIELD_LABELS['vix']:20}: {format_vix(vix_value)}")
     print()
     print(format_executives(stock_info.directors))
-    print(DISPLAY_CONFIG.horizontal_line * DISPLAY_CONFIG.summary_width)
+    print(DISPLAY_CONFIG.horizontal_rule)
 
     if risk_analysis.has_risks:
         print(format_risk_details(risk_analysis))
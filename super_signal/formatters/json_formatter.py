@@ -6,6 +6,8 @@ scripts, APIs, and programmatic consumption.
 
 import json
 import datetime
+import math
+import re
 from typing import Optional, Any, Dict, List, TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
@@ -16,6 +18,82 @@ from ..models import StockInfo, RiskAnalysis
 if TYPE_CHECKING:
     from ..cli import TickerResult
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+
+# Characters json.dumps escapes under ensure_ascii that orjson writes raw
+_NON_ASCII = re.compile(r"[^\x00-\x7e]")
+
+# Tokens in orjson output that the stdlib renders differently: strings
+# (non-ASCII escaping) and floats (exponent and notation thresholds, e.g.
+# 1e16 vs 1e+16 and 0.00001 vs 1e-05). Strings are matched first so digits
+# inside them are never taken for numbers; bare integers already agree.
+_ORJSON_TOKEN = re.compile(
+    r'"(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+(?:[eE][-+]?\d+)?|[eE][-+]?\d+)'
+)
+
+
+def _escape_non_ascii(match: "re.Match[str]") -> str:
+    """Escape one character as json.dumps(ensure_ascii=True) would."""
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xD800 | (code >> 10):04x}\\u{0xDC00 | (code & 0x3FF):04x}"
+
+
+def _to_stdlib_token(match: "re.Match[str]") -> str:
+    """Rewrite one orjson string or float token as json.dumps writes it."""
+    token = match.group()
+    if token[0] == '"':
+        return _NON_ASCII.sub(_escape_non_ascii, token)
+    # orjson floats round-trip exactly, and json.dumps writes float repr
+    return repr(float(token))
+
+
+def _finite(value: Any) -> Any:
+    """Replace NaN and infinite floats with None, recursing into containers.
+
+    The stdlib writes these as bare NaN/Infinity (not valid JSON) while
+    orjson writes null, so both encoders get null-safe input.
+    """
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a payload as indented, ASCII-only JSON.
+
+    Uses orjson when it is installed, then rewrites its strings (escaping
+    non-ASCII characters) and floats (Python repr notation) so the output
+    matches json.dumps(data, indent=2) exactly.
+    Payloads orjson rejects (e.g. integers wider than 64 bits) fall back to
+    the stdlib encoder. Non-finite floats are written as null either way.
+
+    Args:
+        data: JSON-serializable payload
+
+    Returns:
+        JSON string indented by two spaces
+    """
+    data = _finite(data)
+    if orjson is not None:
+        try:
+            text = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            return _ORJSON_TOKEN.sub(_to_stdlib_token, text)
+    return json.dumps(data, indent=2)
+
 
 class JsonFormatter(BaseFormatter):
     """Formatter that produces JSON output."""
@@ -39,7 +117,7 @@ class JsonFormatter(BaseFormatter):
             JSON string with structured stock data
         """
         data = self._build_data_dict(stock_info, risk_analysis, vix_value)
-        return json.dumps(data, indent=2)
+        return _dumps(data)
 
     def _build_data_dict(
         self,
@@ -185,7 +263,7 @@ class JsonFormatter(BaseFormatter):
             "results": result_data
         }
 
-        return json.dumps(wrapper, indent=2)
+        return _dumps(wrapper)
 
     @staticmethod
     def _to_percent(value: Optional[float]) -> Optional[float]:
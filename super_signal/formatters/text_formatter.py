@@ -4,7 +4,8 @@ This formatter wraps the existing display functions to produce
 colored terminal output (current default behavior).
 """
 
-from typing import Optional, List, TYPE_CHECKING
+import re
+from typing import Callable, Optional, List, Tuple, TYPE_CHECKING
 
 from .base import BaseFormatter
 
@@ -26,12 +27,32 @@ from .display import (
     format_vix,
 )
 from ..models import StockInfo, RiskAnalysis
-from ..config import DISPLAY_CONFIG, FIELD_LABELS
+from ..config import ANSIColor, DISPLAY_CONFIG, FIELD_LABELS
+
+# Matches ANSI SGR/CSI escape sequences such as "\033[1;36m"
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+# Error line with its colors baked in; filled per ticker with str.format
+_ERROR_TEMPLATE = (
+    f"{ANSIColor.RED.value}Error for {{ticker}}: {{error}}{ANSIColor.RESET.value}"
+)
 
 
 class TextFormatter(BaseFormatter):
     """Formatter that produces ANSI-colored text output for terminals."""
 
+    @staticmethod
+    def strip_ansi(text: str) -> str:
+        """Remove ANSI escape sequences from formatted text.
+
+        Args:
+            text: Text possibly containing ANSI color codes
+
+        Returns:
+            Text with all ANSI escape sequences removed
+        """
+        return _ANSI_RE.sub("", text)
+
     def format(
         self,
         stock_info: StockInfo,
@@ -50,7 +71,54 @@ class TextFormatter(BaseFormatter):
         Returns:
             ANSI-colored text string for terminal display
         """
-        sections = [
+        if vix_value is not None:
+            return self._format_with_vix(
+                stock_info, risk_analysis, float_threshold, vix_value
+            )
+        return self._format_no_vix(stock_info, risk_analysis, float_threshold)
+
+    def _format_with_vix(
+        self,
+        stock_info: StockInfo,
+        risk_analysis: RiskAnalysis,
+        float_threshold: int,
+        vix_value: float
+    ) -> str:
+        """Format stock data with a VIX line (vix_value must not be None)."""
+        vix_part = (f"{FIELD_LABELS['vix']:20}: {format_vix(vix_value)}",)
+        return self._join_sections(
+            stock_info, risk_analysis, float_threshold, vix_part
+        )
+
+    def _format_no_vix(
+        self,
+        stock_info: StockInfo,
+        risk_analysis: RiskAnalysis,
+        float_threshold: int,
+        vix_value: Optional[float] = None
+    ) -> str:
+        """Format stock data without a VIX line."""
+        return self._join_sections(stock_info, risk_analysis, float_threshold, ())
+
+    @staticmethod
+    def _join_sections(
+        stock_info: StockInfo,
+        risk_analysis: RiskAnalysis,
+        float_threshold: int,
+        vix_part: Tuple[str, ...]
+    ) -> str:
+        """Join all summary sections around the given VIX section.
+
+        Args:
+            stock_info: Stock information data
+            risk_analysis: Risk analysis results
+            float_threshold: Minimum float threshold for risk highlighting
+            vix_part: Zero or one preformatted VIX lines
+
+        Returns:
+            ANSI-colored text string for terminal display
+        """
+        fixed = (
             format_header(stock_info.ticker),
             format_risk_flags(risk_analysis),
             format_basic_info(stock_info),
@@ -61,19 +129,25 @@ class TextFormatter(BaseFormatter):
             format_financial_info(stock_info),
             format_company_info(stock_info),
             format_timestamp(),
-        ]
-
-        if vix_value is not None:
-            sections.append(f"{FIELD_LABELS['vix']:20}: {format_vix(vix_value)}")
-
-        sections.append("")
-        sections.append(format_executives(stock_info.directors))
-        sections.append(DISPLAY_CONFIG.horizontal_line * DISPLAY_CONFIG.summary_width)
+        )
+        tail = (
+            "",
+            format_executives(stock_info.directors),
+            DISPLAY_CONFIG.horizontal_rule,
+        )
+        risk_part = (
+            (format_risk_details(risk_analysis),)
+            if risk_analysis.has_risks
+            else ()
+        )
 
-        if risk_analysis.has_risks:
-            sections.append(format_risk_details(risk_analysis))
+        return "\n".join(fixed + vix_part + tail + risk_part)
 
-        return "\n".join(sections)
+    def _format_for(self, vix_value: Optional[float]) -> Callable[..., str]:
+        """Pick the VIX-specialized format method once per batch."""
+        if vix_value is not None:
+            return self._format_with_vix
+        return self._format_no_vix
 
     def format_batch(
         self,
@@ -91,21 +165,9 @@ class TextFormatter(BaseFormatter):
         Returns:
             Formatted string output with separators between stocks
         """
-        from ..config import ANSIColor
-        separator = f"\n{ANSIColor.CYAN.value}{'=' * DISPLAY_CONFIG.summary_width}{ANSIColor.RESET.value}\n"
-
-        outputs = []
-        for result in results:
-            if result.success:
-                outputs.append(self.format(
-                    result.stock_info,
-                    result.risk_analysis,
-                    float_threshold,
-                    vix_value
-                ))
-            else:
-                outputs.append(self.format_error(result.ticker, result.error))
+        separator = f"\n{ANSIColor.CYAN.value}{DISPLAY_CONFIG.separator_rule}{ANSIColor.RESET.value}\n"
 
+        outputs = self._format_results(results, float_threshold, vix_value)
         return separator.join(outputs)
 
     def format_error(self, ticker: str, error: Optional[str]) -> str:
@@ -118,8 +180,4 @@ class TextFormatter(BaseFormatter):
         Returns:
             Formatted error string with colors
         """
-        from ..config import ANSIColor
-        return (
-            f"{ANSIColor.RED.value}Error for {ticker}: "
-            f"{error or 'Unknown error'}{ANSIColor.RESET.value}"
-        )
+        return _ERROR_TEMPLATE.format(ticker=ticker, error=error or "Unknown error")
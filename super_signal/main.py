@@ -12,11 +12,11 @@ from .config import setup_logging
 from .cli import run_cli
 
 
-def parse_arguments():
-    """Parse command-line arguments.
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser.
 
     Returns:
-        Parsed arguments namespace
+        Configured argument parser
     """
     parser = argparse.ArgumentParser(
         description="Super Signal - Advanced stock analysis with risk factor detection"
@@ -47,6 +47,14 @@ def parse_arguments():
         help="Output format: text (colored terminal), json, or csv (default: text)"
     )
 
+    parser.add_argument(
+        "--color",
+        choices=["auto", "always", "never"],
+        default="auto",
+        help="Colorize text output: auto (only on a terminal), always, or "
+             "never (default: auto)"
+    )
+
     parser.add_argument(
         "--log-level",
         "-l",
@@ -62,7 +70,23 @@ def parse_arguments():
     #     help="Launch GUI interface instead of CLI"
     # )
 
-    return parser.parse_args()
+    return parser
+
+
+# Parser is built once at import; parse_arguments() only parses
+_PARSER = _build_parser()
+
+
+def parse_arguments(argv=None):
+    """Parse command-line arguments.
+
+    Args:
+        argv: Argument list to parse (defaults to sys.argv[1:])
+
+    Returns:
+        Parsed arguments namespace
+    """
+    return _PARSER.parse_args(argv)
 
 
 def main():
@@ -79,7 +103,9 @@ def main():
             # Ticker mode (single or multiple)
             from .cli import run_for_tickers, normalize_tickers
             tickers = normalize_tickers(args.tickers)
-            success = run_for_tickers(tickers, output_format=args.format)
+            success = run_for_tickers(
+                tickers, output_format=args.format, color=args.color
+            )
             sys.exit(0 if success else 1)
         else:
             # Interactive mode (always uses text format)
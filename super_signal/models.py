@@ -4,6 +4,7 @@ This module defines the core data structures used throughout the application,
 including stock information, risk flags, and analysis results.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Optional, List
 from enum import Enum
@@ -16,7 +17,25 @@ class RiskSeverity(Enum):
     HIGH = "high"
 
 
-@dataclass
+# Low-cardinality StockInfo fields that repeat across a watchlist
+_INTERNED_FIELDS = (
+    "exchange",
+    "market",
+    "sector",
+    "industry",
+    "country",
+    "country_of_origin",
+)
+
+# Display prefix for each severity, used by RiskFlag.__str__
+_SEV_TAG = {
+    RiskSeverity.LOW: "[LOW] ",
+    RiskSeverity.MEDIUM: "[MEDIUM] ",
+    RiskSeverity.HIGH: "[HIGH] ",
+}
+
+
+@dataclass(slots=True)
 class StockInfo:
     """Comprehensive stock information from Yahoo Finance.
 
@@ -97,6 +116,13 @@ class StockInfo:
     is_adr: bool = False
     directors: List[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Intern repeated short strings so instances share storage."""
+        for name in _INTERNED_FIELDS:
+            value = getattr(self, name)
+            if type(value) is str:
+                setattr(self, name, sys.intern(value))
+
     def get_country(self) -> str:
         """Get the country, preferring 'country' over 'country_of_origin'.
 
@@ -111,14 +137,11 @@ class StockInfo:
         Returns:
             Comma-separated headquarters address string.
         """
-        parts = [
-            self.address1,
-            self.city,
-            self.state,
-            self.zip_code,
-            self.get_country()
-        ]
-        return ", ".join(str(p) for p in parts if p)
+        country = self.country or self.country_of_origin
+        # filter(None, ...) drops missing parts without a Python-level loop
+        return ", ".join(filter(None, (
+            self.address1, self.city, self.state, self.zip_code, country
+        )))
 
     def get_display_name(self) -> str:
         """Get the display name, preferring long_name over short_name.
@@ -143,12 +166,13 @@ class StockInfo:
             Percentage (e.g., -15.5 for 15.5% below high), or None if cannot calculate.
         """
         price = self.get_price()
-        if price and self.fifty_two_week_high and self.fifty_two_week_high > 0:
-            return (price / self.fifty_two_week_high - 1) * 100
+        high = self.fifty_two_week_high
+        if price and high is not None and high > 0:
+            return (price / high - 1) * 100
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskFlag:
     """Individual risk flag detected during analysis.
 
@@ -167,10 +191,10 @@ class RiskFlag:
         Returns:
             Formatted risk flag message with severity.
         """
-        return f"[{self.severity.value.upper()}] {self.message}"
+        return _SEV_TAG[self.severity] + self.message
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskAnalysis:
     """Complete risk analysis results for a stock.
 
@@ -200,7 +224,8 @@ class RiskAnalysis:
         Returns:
             List of risk flags matching the specified severity.
         """
-        return [flag for flag in self.flags if flag.severity == severity]
+        # Enum members are singletons, so identity is an exact match
+        return [flag for flag in self.flags if flag.severity is severity]
 
     def add_flag(self, flag_type: str, message: str,
                  severity: RiskSeverity = RiskSeverity.MEDIUM) -> None:
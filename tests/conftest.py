@@ -1,8 +1,11 @@
 """Shared pytest fixtures for super-signal tests."""
 
+import queue
+from dataclasses import replace
+
 import pytest
 from super_signal.models import StockInfo, RiskFlag, RiskAnalysis, RiskSeverity
-from super_signal.cache import clear_cache
+from super_signal.cache import StockCache, clear_cache
 
 
 @pytest.fixture(autouse=True)
@@ -13,9 +16,49 @@ def clear_cache_between_tests():
     clear_cache()
 
 
+@pytest.fixture(scope="session")
+def _cache_pool():
+    """Hold idle in-memory caches for reuse across tests."""
+    pool = queue.SimpleQueue()
+    yield pool
+    while not pool.empty():
+        pool.get_nowait().close()
+
+
 @pytest.fixture
+def cache(_cache_pool):
+    """Provide an empty in-memory cache without a background sweeper.
+
+    Caches are taken from a session-wide pool and cleared, so tests do not
+    pay for opening connections and creating tables each time.
+    """
+    try:
+        stock_cache = _cache_pool.get_nowait()
+        stock_cache.clear()
+    except queue.Empty:
+        stock_cache = StockCache(db_path=":memory:", sweep_interval=None)
+    yield stock_cache
+    _cache_pool.put(stock_cache)
+
+
+@pytest.fixture(scope="module")
+def shared_cache():
+    """Create one in-memory cache shared by every test in a module.
+
+    Tests using it must write under tickers no other test in the module reads.
+    """
+    stock_cache = StockCache(db_path=":memory:", sweep_interval=None)
+    yield stock_cache
+    stock_cache.close()
+
+
+@pytest.fixture(scope="session")
 def sample_us_stock():
-    """Create a sample US stock with typical data."""
+    """Create a sample US stock with typical data.
+
+    Session-scoped, so tests must not mutate it; derive a copy with
+    dataclasses.replace instead (see sample_us_stock_with_ownership).
+    """
     return StockInfo(
         ticker="AAPL",
         long_name="Apple Inc.",
@@ -39,6 +82,16 @@ def sample_us_stock():
     )
 
 
+@pytest.fixture
+def sample_us_stock_with_ownership(sample_us_stock):
+    """Create a copy of the sample US stock with ownership percentages."""
+    return replace(
+        sample_us_stock,
+        held_percent_insiders=0.15,
+        held_percent_institutions=0.65,
+    )
+
+
 @pytest.fixture
 def sample_foreign_stock():
     """Create a sample foreign (non-US) stock."""
@@ -1,13 +1,71 @@
 """Tests for the in-memory SQLite cache module."""
 
 import time
+from dataclasses import fields
+
 import pytest
 from unittest.mock import patch
 
-from super_signal.cache import StockCache, get_cache, clear_cache, _cache
+from super_signal.cache import (
+    StockCache,
+    get_cache,
+    clear_cache,
+    _NOW_SQL,
+    _SQL_GET_ADR_STATUS,
+    _SQL_GET_DIRECTORS,
+)
 from super_signal.models import StockInfo
 
 
+# Values for every StockInfo field, used to check a full cache round trip
+_FULL_STOCK_INFO_KWARGS = {
+    "ticker": "TEST",
+    "long_name": "Test Company",
+    "short_name": "Test",
+    "country": "United States",
+    "country_of_origin": "USA",
+    "address1": "123 Main St",
+    "city": "New York",
+    "state": "NY",
+    "zip_code": "10001",
+    "exchange": "NYSE",
+    "market": "us_market",
+    "sector": "Technology",
+    "industry": "Software",
+    "market_cap": 1000000000,
+    "regular_market_price": 100.50,
+    "pre_market_price": 101.00,
+    "post_market_price": 100.25,
+    "fifty_two_week_high": 120.00,
+    "fifty_two_week_low": 80.00,
+    "average_volume_10days": 5000000,
+    "shares_outstanding": 100000000,
+    "float_shares": 90000000,
+    "total_debt": 500000000,
+    "debt_to_equity": 0.5,
+    "full_time_employees": 10000,
+    "website": "https://test.com",
+    "short_percent_of_float": 0.05,
+    "short_ratio": 2.5,
+    "held_percent_insiders": 0.10,
+    "held_percent_institutions": 0.70,
+    "last_split_factor": "2:1",
+    "last_split_date": 1609459200,
+    "operating_cash_flow": 200000000,
+    "last_split_display": "2021-01-01 (2:1, split)",
+    "is_adr": False,
+    "directors": ["John Doe - Director", "Jane Smith - Director"],
+}
+
+
+@pytest.fixture(scope="module")
+def full_stock_info_round_trip(shared_cache):
+    """Cache a fully populated StockInfo once and read it back."""
+    stock_info = StockInfo(**_FULL_STOCK_INFO_KWARGS)
+    shared_cache.set_stock_info(stock_info)
+    return stock_info, shared_cache.get_stock_info(stock_info.ticker)
+
+
 class TestStockCacheInitialization:
     """Tests for cache initialization."""
 
@@ -55,20 +113,146 @@ class TestStockCacheInitialization:
 
         cache.close()
 
+    def test_fast_pragmas_applied(self):
+        """Test that tuned PRAGMAs are applied by default."""
+        cache = StockCache()
+        cursor = cache.conn.cursor()
+        assert cursor.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert cursor.execute("PRAGMA temp_store").fetchone()[0] == 2  # MEMORY
+        assert cursor.execute("PRAGMA cache_size").fetchone()[0] == -20000
+        cache.close()
+
+    def test_fast_disabled_keeps_sqlite_defaults(self):
+        """Test that fast=False leaves the connection untuned."""
+        cache = StockCache(fast=False)
+        cursor = cache.conn.cursor()
+        assert cursor.execute("PRAGMA cache_size").fetchone()[0] != -20000
+        cache.close()
+
+    def test_file_cache_uses_wal(self, tmp_path):
+        """Test that a file-backed cache switches to WAL journaling."""
+        cache = StockCache(db_path=str(tmp_path / "cache.db"))
+        cursor = cache.conn.cursor()
+        assert cursor.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        cache.close()
+
+    def test_lookups_search_primary_key_only(self, cache):
+        """Test that ADR and directors reads are index-only primary key searches."""
+        for sql in (_SQL_GET_ADR_STATUS, _SQL_GET_DIRECTORS):
+            plan = cache.conn.execute(f"EXPLAIN QUERY PLAN {sql}", ("AAPL",)).fetchall()
+            details = [row[-1] for row in plan]
+            assert all("USING PRIMARY KEY" in detail for detail in details)
+
+
+class TestReadWriteConnections:
+    """Tests for the separate read-only and read-write connections."""
+
+    def test_reads_use_read_only_connection(self, tmp_path):
+        """Test that a file-backed cache reads through a read-only connection."""
+        import sqlite3
+
+        cache = StockCache(db_path=str(tmp_path / "cache.db"))
+        assert cache._ro is not cache.conn
+        with pytest.raises(sqlite3.OperationalError):
+            cache._ro.execute("DELETE FROM stock_info")
+        cache.close()
+
+    def test_in_memory_cache_reads_through_writer(self):
+        """Test that an in-memory cache has no uncommitted-read connection."""
+        cache = StockCache()
+        assert cache._ro is None
+        cache.close()
+
+    @pytest.mark.parametrize("shared", [False, True])
+    def test_reads_never_see_partial_directors_rewrite(self, shared):
+        """Test that concurrent reads only see complete director lists."""
+        import threading
+
+        if shared:
+            uri = "file:super_signal_rewrite_test?mode=memory&cache=shared"
+            writer, reader = StockCache(db_path=uri), StockCache(db_path=uri)
+        else:
+            writer = reader = StockCache()
+        done = threading.Event()
+        seen = []
+
+        def rewrite():
+            for _ in range(2000):
+                writer.set_directors("K", ["a", "b"])
+            done.set()
+
+        thread = threading.Thread(target=rewrite)
+        thread.start()
+        while not done.is_set():
+            directors, hit = reader.get_directors("K")
+            if hit:
+                seen.append(directors)
+        thread.join()
+
+        assert seen
+        assert all(directors == ["a", "b"] for directors in seen)
+        reader.close()
+        if shared:
+            writer.close()
+
+    def test_in_memory_caches_are_isolated(self):
+        """Test that two in-memory caches do not share data."""
+        cache1 = StockCache()
+        cache2 = StockCache()
+        cache1.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple"))
+
+        assert cache1.get_stock_info("AAPL") is not None
+        assert cache2.get_stock_info("AAPL") is None
+        cache1.close()
+        cache2.close()
+
+    def test_private_memory_cache_is_not_shared_cache(self):
+        """Test that a default cache opens a plain private :memory: database."""
+        with patch.object(
+            StockCache, "_connect", side_effect=StockCache._connect
+        ) as connect:
+            cache = StockCache()
+
+        assert [call.args[0] for call in connect.call_args_list] == [":memory:"]
+        cache.close()
+
+    def test_file_uri_is_passed_through(self, tmp_path, monkeypatch):
+        """Test that a file: URI opens the file it names, not a literal path."""
+        import sqlite3
+
+        monkeypatch.chdir(tmp_path)
+        db_file = tmp_path / "uri.db"
+        cache = StockCache(db_path=f"{db_file.as_uri()}?mode=rwc")
+        cache.set_adr_status("AAPL", True)
+
+        assert db_file.exists()
+        assert not any(path.name.startswith("file:") for path in tmp_path.iterdir())
+        assert cache.get_adr_status("AAPL") == (True, True)
+        with pytest.raises(sqlite3.OperationalError):
+            cache._ro.execute("DELETE FROM adr_status")
+        cache.close()
+
+    def test_file_cache_reader_sees_writes(self, tmp_path):
+        """Test that a file-backed cache reads back committed writes."""
+        cache = StockCache(db_path=str(tmp_path / "cache.db"))
+        cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple"))
+        cache.set_directors("AAPL", ["Tim Cook - Director"])
+
+        assert cache.get_stock_info("AAPL").long_name == "Apple"
+        assert cache.get_directors("AAPL") == (["Tim Cook - Director"], True)
+        cache.close()
+
 
 class TestStockInfoCache:
     """Tests for stock info caching."""
 
-    def test_get_stock_info_cache_miss(self):
+    def test_get_stock_info_cache_miss(self, cache):
         """Test that cache miss returns None."""
-        cache = StockCache()
         result = cache.get_stock_info("AAPL")
         assert result is None
-        cache.close()
 
-    def test_set_and_get_stock_info(self):
+    def test_set_and_get_stock_info(self, cache):
         """Test setting and getting stock info."""
-        cache = StockCache()
         stock_info = StockInfo(
             ticker="AAPL",
             long_name="Apple Inc.",
@@ -86,11 +270,9 @@ class TestStockInfoCache:
         assert result.country == "United States"
         assert result.exchange == "NASDAQ"
         assert result.market_cap == 3000000000000
-        cache.close()
 
-    def test_stock_info_cache_case_insensitive(self):
+    def test_stock_info_cache_case_insensitive(self, cache):
         """Test that ticker lookup is case-insensitive."""
-        cache = StockCache()
         stock_info = StockInfo(ticker="AAPL", long_name="Apple Inc.")
 
         cache.set_stock_info(stock_info)
@@ -99,11 +281,9 @@ class TestStockInfoCache:
         assert cache.get_stock_info("aapl") is not None
         assert cache.get_stock_info("Aapl") is not None
         assert cache.get_stock_info("AAPL") is not None
-        cache.close()
 
-    def test_stock_info_cache_overwrites(self):
+    def test_stock_info_cache_overwrites(self, cache):
         """Test that setting stock info twice overwrites the first."""
-        cache = StockCache()
         stock_info1 = StockInfo(ticker="AAPL", long_name="Apple Inc.")
         stock_info2 = StockInfo(ticker="AAPL", long_name="Apple Corporation")
 
@@ -112,62 +292,67 @@ class TestStockInfoCache:
 
         result = cache.get_stock_info("AAPL")
         assert result.long_name == "Apple Corporation"
-        cache.close()
 
-    def test_stock_info_preserves_all_fields(self):
+    def test_stock_info_overwrite_ignores_case(self, cache):
+        """Test that tickers differing only in case share one cache row."""
+        cache.set_stock_info(StockInfo(ticker="aapl", long_name="Apple Inc."))
+        cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple Corporation"))
+
+        count = cache.conn.execute("SELECT COUNT(*) FROM stock_info").fetchone()[0]
+        assert count == 1
+        assert cache.get_stock_info("Aapl").long_name == "Apple Corporation"
+
+    def test_stock_info_overwrite_updates_in_place(self, cache):
+        """Test that overwriting stock info keeps the existing row."""
+        cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple Inc."))
+        cache.set_stock_info(StockInfo(ticker="MSFT", long_name="Microsoft"))
+        sql = "SELECT rowid FROM stock_info WHERE ticker = 'AAPL'"
+        rowid = cache.conn.execute(sql).fetchone()[0]
+
+        cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple Corporation"))
+
+        assert cache.conn.execute(sql).fetchone()[0] == rowid
+        assert cache.get_stock_info("AAPL").long_name == "Apple Corporation"
+
+    @pytest.mark.parametrize("field_name", [f.name for f in fields(StockInfo)])
+    def test_stock_info_preserves_all_fields(
+        self, full_stock_info_round_trip, field_name
+    ):
         """Test that all StockInfo fields are preserved through cache."""
-        cache = StockCache()
-        stock_info = StockInfo(
-            ticker="TEST",
-            long_name="Test Company",
-            short_name="Test",
-            country="United States",
-            country_of_origin="USA",
-            address1="123 Main St",
-            city="New York",
-            state="NY",
-            zip_code="10001",
-            exchange="NYSE",
-            market="us_market",
-            sector="Technology",
-            industry="Software",
-            market_cap=1000000000,
-            regular_market_price=100.50,
-            pre_market_price=101.00,
-            post_market_price=100.25,
-            fifty_two_week_high=120.00,
-            fifty_two_week_low=80.00,
-            average_volume_10days=5000000,
-            shares_outstanding=100000000,
-            float_shares=90000000,
-            total_debt=500000000,
-            debt_to_equity=0.5,
-            full_time_employees=10000,
-            website="https://test.com",
-            short_percent_of_float=0.05,
-            short_ratio=2.5,
-            held_percent_insiders=0.10,
-            held_percent_institutions=0.70,
-            last_split_factor="2:1",
-            last_split_date=1609459200,
-            operating_cash_flow=200000000,
-            last_split_display="2021-01-01 (2:1, split)",
-            is_adr=False,
-            directors=["John Doe - Director", "Jane Smith - Director"],
+        stock_info, result = full_stock_info_round_trip
+        assert getattr(result, field_name) == getattr(stock_info, field_name)
+
+    def test_stock_info_stored_as_blob(self, cache):
+        """Test that stock info is stored as a binary blob."""
+        cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple Inc."))
+
+        row = cache.conn.execute(
+            "SELECT typeof(data) FROM stock_info WHERE ticker = ?", ("AAPL",)
+        ).fetchone()
+        assert row[0] == "blob"
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b'{"ticker": "AAPL", "long_name": ',
+            b'{"ticker": "\xff"}',
+            b"[1, 2]",
+            b'{"ticker": "AAPL", "unknown_field": 1}',
+        ],
+    )
+    def test_unreadable_stock_info_is_a_miss(self, cache, data):
+        """Test that an undecodable row is treated as a miss and deleted."""
+        cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple Inc."))
+        cache.conn.execute(
+            "UPDATE stock_info SET data = ? WHERE ticker = ?", (data, "AAPL")
         )
+        cache.conn.commit()
 
-        cache.set_stock_info(stock_info)
-        result = cache.get_stock_info("TEST")
-
-        assert result.ticker == stock_info.ticker
-        assert result.long_name == stock_info.long_name
-        assert result.short_name == stock_info.short_name
-        assert result.country == stock_info.country
-        assert result.market_cap == stock_info.market_cap
-        assert result.regular_market_price == stock_info.regular_market_price
-        assert result.is_adr == stock_info.is_adr
-        assert result.directors == stock_info.directors
-        cache.close()
+        assert cache.get_stock_info("AAPL") is None
+        row = cache.conn.execute(
+            "SELECT COUNT(*) FROM stock_info WHERE ticker = ?", ("AAPL",)
+        ).fetchone()
+        assert row[0] == 0
 
     def test_stock_info_expiration(self):
         """Test that expired stock info is not returned."""
@@ -184,66 +369,92 @@ class TestStockInfoCache:
         cache.close()
 
 
+class TestBatchSetters:
+    """Tests for the batch cache setters."""
+
+    def test_set_stock_info_many(self, cache):
+        """Test caching several stock infos at once."""
+        cache.set_stock_info_many([
+            StockInfo(ticker="AAPL", long_name="Apple"),
+            StockInfo(ticker="msft", long_name="Microsoft"),
+        ])
+
+        assert cache.get_stock_info("AAPL").long_name == "Apple"
+        assert cache.get_stock_info("MSFT").long_name == "Microsoft"
+
+    def test_set_stock_info_many_empty(self, cache):
+        """Test that an empty batch is a no-op."""
+        cache.set_stock_info_many([])
+        assert cache.get_stock_info("AAPL") is None
+
+    def test_set_directors_many(self, cache):
+        """Test caching directors for several tickers at once."""
+        cache.set_directors_many([
+            ("AAPL", ["Tim Cook - Director"]),
+            ("msft", []),
+        ])
+
+        assert cache.get_directors("AAPL") == (["Tim Cook - Director"], True)
+        assert cache.get_directors("MSFT") == ([], True)
+
+    def test_set_directors_many_duplicate_ticker_last_wins(self, cache):
+        """Test that a repeated ticker in one batch keeps the last list."""
+        cache.set_directors_many([
+            ("AAPL", ["A", "B", "C"]),
+            ("aapl", ["D"]),
+        ])
+
+        assert cache.get_directors("AAPL") == (["D"], True)
+
+
 class TestAdrStatusCache:
     """Tests for ADR status caching."""
 
-    def test_get_adr_status_cache_miss(self):
+    def test_get_adr_status_cache_miss(self, cache):
         """Test that cache miss returns (None, False)."""
-        cache = StockCache()
         result, hit = cache.get_adr_status("AAPL")
         assert result is None
         assert hit is False
-        cache.close()
 
-    def test_set_and_get_adr_status_true(self):
+    def test_set_and_get_adr_status_true(self, cache):
         """Test caching ADR status as True."""
-        cache = StockCache()
         cache.set_adr_status("BABA", True)
 
         result, hit = cache.get_adr_status("BABA")
         assert result is True
         assert hit is True
-        cache.close()
 
-    def test_set_and_get_adr_status_false(self):
+    def test_set_and_get_adr_status_false(self, cache):
         """Test caching ADR status as False."""
-        cache = StockCache()
         cache.set_adr_status("AAPL", False)
 
         result, hit = cache.get_adr_status("AAPL")
         assert result is False
         assert hit is True
-        cache.close()
 
-    def test_set_and_get_adr_status_none(self):
+    def test_set_and_get_adr_status_none(self, cache):
         """Test caching ADR status as None (unknown)."""
-        cache = StockCache()
         cache.set_adr_status("UNKN", None)
 
         result, hit = cache.get_adr_status("UNKN")
         assert result is None
         assert hit is True  # Cache hit, but value is None
-        cache.close()
 
-    def test_adr_status_case_insensitive(self):
+    def test_adr_status_case_insensitive(self, cache):
         """Test that ADR status lookup is case-insensitive."""
-        cache = StockCache()
         cache.set_adr_status("BABA", True)
 
         result, hit = cache.get_adr_status("baba")
         assert result is True
         assert hit is True
-        cache.close()
 
-    def test_adr_status_overwrites(self):
+    def test_adr_status_overwrites(self, cache):
         """Test that setting ADR status twice overwrites the first."""
-        cache = StockCache()
         cache.set_adr_status("BABA", True)
         cache.set_adr_status("BABA", False)
 
         result, hit = cache.get_adr_status("BABA")
         assert result is False
-        cache.close()
 
     def test_adr_status_expiration(self):
         """Test that expired ADR status is not returned."""
@@ -263,17 +474,14 @@ class TestAdrStatusCache:
 class TestDirectorsCache:
     """Tests for directors caching."""
 
-    def test_get_directors_cache_miss(self):
+    def test_get_directors_cache_miss(self, cache):
         """Test that cache miss returns (None, False)."""
-        cache = StockCache()
         result, hit = cache.get_directors("AAPL")
         assert result is None
         assert hit is False
-        cache.close()
 
-    def test_set_and_get_directors(self):
+    def test_set_and_get_directors(self, cache):
         """Test setting and getting directors."""
-        cache = StockCache()
         directors = ["John Doe - Director", "Jane Smith - Independent Director"]
 
         cache.set_directors("AAPL", directors)
@@ -282,36 +490,68 @@ class TestDirectorsCache:
         assert hit is True
         assert result == directors
         assert len(result) == 2
-        cache.close()
 
-    def test_set_and_get_empty_directors(self):
+    def test_set_and_get_empty_directors(self, cache):
         """Test caching empty directors list."""
-        cache = StockCache()
         cache.set_directors("AAPL", [])
 
         result, hit = cache.get_directors("AAPL")
         assert hit is True
         assert result == []
-        cache.close()
 
-    def test_directors_case_insensitive(self):
+    def test_directors_case_insensitive(self, cache):
         """Test that directors lookup is case-insensitive."""
-        cache = StockCache()
         cache.set_directors("AAPL", ["John Doe - Director"])
 
         result, hit = cache.get_directors("aapl")
         assert hit is True
         assert len(result) == 1
-        cache.close()
 
-    def test_directors_overwrites(self):
+    def test_directors_overwrites(self, cache):
         """Test that setting directors twice overwrites the first."""
-        cache = StockCache()
         cache.set_directors("AAPL", ["John Doe"])
         cache.set_directors("AAPL", ["Jane Smith"])
 
         result, hit = cache.get_directors("AAPL")
         assert result == ["Jane Smith"]
+
+    def test_directors_order_preserved(self, cache):
+        """Test that director order survives the round trip."""
+        directors = [f"Director {i}" for i in range(12)]
+        cache.set_directors("AAPL", directors)
+
+        result, hit = cache.get_directors("AAPL")
+        assert result == directors
+
+    def test_directors_hash_tracks_list_contents(self, cache):
+        """Test that the directors hash changes only when the list does."""
+        assert cache.get_directors_hash("AAPL") is None
+
+        cache.set_directors("AAPL", ["Tim Cook", "Jeff Williams"])
+        cache.set_directors("MSFT", ["Tim Cook", "Jeff Williams"])
+        cache.set_directors("GOOG", ["Jeff Williams", "Tim Cook"])
+
+        digest = cache.get_directors_hash("aapl")
+        assert isinstance(digest, bytes)
+        assert digest == cache.get_directors_hash("MSFT")
+        assert digest != cache.get_directors_hash("GOOG")
+
+    def test_directors_hash_distinguishes_name_boundaries(self, cache):
+        """Test that splitting names differently yields a different hash."""
+        cache.set_directors("AAPL", ["ab", "c"])
+        cache.set_directors("MSFT", ["a", "bc"])
+        assert cache.get_directors_hash("AAPL") != cache.get_directors_hash("MSFT")
+
+    def test_purge_removes_expired_director_items(self):
+        """Test that purging expired directors also drops their items."""
+        cache = StockCache(ttl=0, sweep_interval=None)
+        cache.set_directors("AAPL", ["John Doe", "Jane Smith"])
+        cache.purge_expired()
+
+        count = cache.conn.execute(
+            "SELECT COUNT(*) FROM directors_items"
+        ).fetchone()[0]
+        assert count == 0
         cache.close()
 
     def test_directors_expiration(self):
@@ -332,9 +572,8 @@ class TestDirectorsCache:
 class TestCacheClear:
     """Tests for cache clearing."""
 
-    def test_clear_removes_all_data(self):
+    def test_clear_removes_all_data(self, cache):
         """Test that clear removes all cached data."""
-        cache = StockCache()
 
         # Add data to all tables
         cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple"))
@@ -353,11 +592,9 @@ class TestCacheClear:
         assert cache.get_stock_info("AAPL") is None
         assert cache.get_adr_status("BABA")[1] is False
         assert cache.get_directors("MSFT")[1] is False
-        cache.close()
 
-    def test_clear_allows_new_data(self):
+    def test_clear_allows_new_data(self, cache):
         """Test that cache can be used after clearing."""
-        cache = StockCache()
 
         cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple"))
         cache.clear()
@@ -365,7 +602,109 @@ class TestCacheClear:
 
         assert cache.get_stock_info("AAPL") is None
         assert cache.get_stock_info("MSFT") is not None
+
+    def test_clear_with_vacuum(self, tmp_path):
+        """Test that clear(vacuum=True) empties and compacts the database."""
+        cache = StockCache(db_path=str(tmp_path / "cache.db"))
+        cache.set_stock_info_many([
+            StockInfo(ticker=f"T{i}", long_name="x" * 500) for i in range(200)
+        ])
+        cache.clear(vacuum=True)
+
+        freelist = cache.conn.execute("PRAGMA freelist_count").fetchone()[0]
+        assert freelist == 0
+        assert cache.get_stock_info("T1") is None
+        cache.close()
+
+
+class TestExpirySweeper:
+    """Tests for purging expired entries."""
+
+    def test_purge_expired_removes_only_expired_rows(self):
+        """Test that purge_expired deletes expired rows from every table."""
+        cache = StockCache(ttl=0)
+        cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple"))
+        cache.set_adr_status("BABA", True)
+        cache.set_directors("MSFT", ["John Doe"])
+        cache.ttl = 3600
+        cache.set_stock_info(StockInfo(ticker="GOOG", long_name="Alphabet"))
+
+        assert cache.purge_expired() == 3
+        assert cache.purge_expired() == 0
+        assert cache.get_stock_info("GOOG") is not None
+        cache.close()
+
+    def test_sweep_purges_expired_rows(self):
+        """Test that one sweep purges expired rows without rescheduling."""
+        cache = StockCache(ttl=0)
+        cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple"))
+        cache._sweep()
+
+        count = cache.conn.execute("SELECT COUNT(*) FROM stock_info").fetchone()[0]
+        assert count == 0
+        assert cache._sweeper is None
+        cache.close()
+
+    def test_sweep_reschedules_when_enabled(self):
+        """Test that a sweep arms the next one when an interval is set."""
+        cache = StockCache(sweep_interval=60)
+        first = cache._sweeper
+        cache._sweep()
+
+        assert cache._sweeper is not first
+        assert cache._sweeper.is_alive()
         cache.close()
+        assert cache._sweeper.finished.is_set()
+
+    def test_close_cancels_sweeper(self):
+        """Test that close stops the background sweeper."""
+        cache = StockCache(sweep_interval=60)
+        sweeper = cache._sweeper
+        cache.close()
+        assert sweeper.finished.is_set()
+
+    def test_open_purges_expired_rows(self, tmp_path):
+        """Test that opening a file-backed cache drops rows that expired."""
+        db_path = str(tmp_path / "cache.db")
+        cache = StockCache(ttl=0, db_path=db_path)
+        cache.set_adr_status("AAPL", True)
+        cache.ttl = 3600
+        cache.set_adr_status("GOOG", False)
+        cache.close()
+
+        reopened = StockCache(db_path=db_path)
+        rows = reopened.conn.execute("SELECT ticker FROM adr_status").fetchall()
+        assert rows == [("GOOG",)]
+        reopened.close()
+
+    def test_sweeper_disabled_by_default(self):
+        """Test that a cache built with default arguments starts no sweeper."""
+        cache = StockCache()
+        assert cache._sweeper is None
+        cache.close()
+
+    def test_global_cache_sweeper_runs_once(self):
+        """Test that only the global cache's anchor instance runs a sweeper."""
+        import threading
+        from super_signal import cache as cache_module
+
+        sweepers = []
+
+        def worker():
+            sweepers.append(get_cache()._sweeper)
+
+        for _ in range(2):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        assert sweepers == [None, None]
+        assert cache_module._global_cache._sweeper is not None
+
+    def test_expiry_clock_matches_unix_time(self, cache):
+        """Test that the SQL clock used for expiry tracks time.time()."""
+        sql_now = cache.conn.execute(f"SELECT {_NOW_SQL}").fetchone()[0]
+        assert abs(sql_now - time.time()) < 1
 
 
 class TestGlobalCacheFunctions:
@@ -391,13 +730,67 @@ class TestGlobalCacheFunctions:
 
         assert cache.get_stock_info("AAPL") is None
 
+    def test_clear_cache_from_fresh_thread_clears_shared_data(self):
+        """Test that clear_cache works from a thread that never used the cache."""
+        import threading
+
+        cache = get_cache()
+        cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple"))
+
+        thread = threading.Thread(target=clear_cache)
+        thread.start()
+        thread.join()
+
+        assert cache.get_stock_info("AAPL") is None
+
+    def test_clear_cache_without_global_cache_is_noop(self, monkeypatch):
+        """Test that clear_cache creates no cache when none exists."""
+        from super_signal import cache as cache_module
+
+        monkeypatch.setattr(cache_module, "_global_cache", None)
+        with patch.object(cache_module, "StockCache") as stock_cache:
+            clear_cache()
+
+        stock_cache.assert_not_called()
+        assert cache_module._global_cache is None
+
+    def test_worker_cache_closed_when_thread_exits(self):
+        """Test that a worker thread's cache is closed once the thread ends."""
+        import threading
+
+        caches = []
+        thread = threading.Thread(target=lambda: caches.append(get_cache()))
+        thread.start()
+        thread.join()
+
+        assert caches[0]._closed
+
+    def test_get_cache_is_per_thread_with_shared_data(self):
+        """Test that threads get their own instance but share cached data."""
+        import threading
+
+        main_cache = get_cache()
+        main_cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple"))
+        seen = {}
+
+        def worker():
+            cache = get_cache()
+            seen["same_instance"] = cache is main_cache
+            seen["stock"] = cache.get_stock_info("AAPL")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        assert seen["same_instance"] is False
+        assert seen["stock"].long_name == "Apple"
+
 
 class TestCacheIntegration:
     """Integration tests for cache with fetchers."""
 
-    def test_multiple_tickers_cached_separately(self):
+    def test_multiple_tickers_cached_separately(self, cache):
         """Test that different tickers are cached separately."""
-        cache = StockCache()
 
         cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple"))
         cache.set_stock_info(StockInfo(ticker="MSFT", long_name="Microsoft"))
@@ -406,11 +799,9 @@ class TestCacheIntegration:
         assert cache.get_stock_info("AAPL").long_name == "Apple"
         assert cache.get_stock_info("MSFT").long_name == "Microsoft"
         assert cache.get_stock_info("GOOG").long_name == "Alphabet"
-        cache.close()
 
-    def test_mixed_data_types_cached(self):
+    def test_mixed_data_types_cached(self, cache):
         """Test caching different data types for same ticker."""
-        cache = StockCache()
 
         cache.set_stock_info(StockInfo(ticker="AAPL", long_name="Apple"))
         cache.set_adr_status("AAPL", False)
@@ -419,11 +810,9 @@ class TestCacheIntegration:
         assert cache.get_stock_info("AAPL").long_name == "Apple"
         assert cache.get_adr_status("AAPL") == (False, True)
         assert cache.get_directors("AAPL") == (["Tim Cook - Director"], True)
-        cache.close()
 
-    def test_cache_handles_special_characters_in_directors(self):
+    def test_cache_handles_special_characters_in_directors(self, cache):
         """Test that cache handles special characters in director names."""
-        cache = StockCache()
         directors = [
             "Jean-Pierre Dupont - Director",
             "Maria Garcia-Lopez - Independent Director",
@@ -435,11 +824,9 @@ class TestCacheIntegration:
 
         assert hit is True
         assert result == directors
-        cache.close()
 
-    def test_cache_handles_unicode_in_stock_info(self):
+    def test_cache_handles_unicode_in_stock_info(self, cache):
         """Test that cache handles unicode in stock info."""
-        cache = StockCache()
         stock_info = StockInfo(
             ticker="TEST",
             long_name="Societe Generale S.A.",
@@ -451,4 +838,3 @@ class TestCacheIntegration:
         result = cache.get_stock_info("TEST")
 
         assert result.long_name == "Societe Generale S.A."
-        cache.close()
@@ -1,8 +1,10 @@
 """Tests for CLI functions."""
 
+import io
 import pytest
+from unittest.mock import patch
 
-from super_signal.cli import normalize_tickers, TickerResult
+from super_signal.cli import normalize_tickers, use_color, emit_output, TickerResult
 from super_signal.models import StockInfo, RiskAnalysis
 
 
@@ -105,3 +107,71 @@ class TestTickerResult:
         result = TickerResult(ticker="INVALID", error=error_msg)
         assert result.error == error_msg
         assert result.success is False
+
+
+class TestColorOutput:
+    """Tests for color mode selection and ANSI stripping on output."""
+
+    def test_use_color_always(self):
+        """Test that 'always' keeps colors regardless of terminal."""
+        assert use_color("always") is True
+
+    def test_use_color_never(self):
+        """Test that 'never' disables colors."""
+        assert use_color("never") is False
+
+    def test_use_color_auto_follows_isatty(self):
+        """Test that 'auto' follows whether stdout is a terminal."""
+        with patch("sys.stdout") as mock_stdout:
+            mock_stdout.isatty.return_value = True
+            assert use_color("auto") is True
+            mock_stdout.isatty.return_value = False
+            assert use_color("auto") is False
+
+    def test_emit_output_strips_text_without_color(self, capsys):
+        """Test that text output loses ANSI codes when color is off."""
+        emit_output("\033[31mred\033[0m", "text", color="never")
+        assert capsys.readouterr().out == "red\n"
+
+    def test_emit_output_keeps_text_with_color(self, capsys):
+        """Test that text output keeps ANSI codes when color is on."""
+        emit_output("\033[31mred\033[0m", "text", color="always")
+        assert capsys.readouterr().out == "\033[31mred\033[0m\n"
+
+    def test_emit_output_writes_encoded_bytes_when_piped(self):
+        """Test that non-TTY output is written once to the binary buffer."""
+        raw = io.BytesIO()
+        fake_stdout = io.TextIOWrapper(raw, encoding="utf-8", newline="\n")
+        with patch("sys.stdout", fake_stdout):
+            emit_output("caf\u00e9", "json")
+            assert raw.getvalue() == "caf\u00e9\n".encode("utf-8")
+
+    def test_emit_output_keeps_newlines_when_piped(self):
+        """Test that piped output is not rewritten to the platform line ending."""
+        raw = io.BytesIO()
+        fake_stdout = io.TextIOWrapper(raw, encoding="utf-8", newline="\n")
+        with patch("sys.stdout", fake_stdout), patch("os.linesep", "\r\n"):
+            emit_output("a\nb", "csv")
+            assert raw.getvalue() == b"a\nb\n"
+
+
+class TestParseArguments:
+    """Tests for command-line argument parsing."""
+
+    def test_repeated_parses_do_not_share_state(self):
+        """Test that the shared parser does not leak appended tickers."""
+        from super_signal.main import parse_arguments
+
+        first = parse_arguments(["-t", "AAPL", "-t", "GOOG"])
+        second = parse_arguments(["-t", "MSFT"])
+        assert first.tickers == ["AAPL", "GOOG"]
+        assert second.tickers == ["MSFT"]
+
+    def test_defaults(self):
+        """Test default format and color mode."""
+        from super_signal.main import parse_arguments
+
+        args = parse_arguments([])
+        assert args.tickers is None
+        assert args.format == "text"
+        assert args.color == "auto"
@@ -0,0 +1,47 @@
+"""Regression guard for test collection time."""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Repository root, so the collected paths resolve regardless of cwd
+_ROOT = Path(__file__).resolve().parent.parent
+
+# Wall-clock budget for a fresh interpreter to import and collect the modules
+# below; today it takes well under a second, so this only trips on a real
+# regression such as a heavy import or data build at module scope
+_COLLECT_BUDGET_SECONDS = 5.0
+
+
+@pytest.mark.skipif(
+    os.environ.get("CI") != "true",
+    reason="timing guard runs in CI only; local machines are too noisy",
+)
+class TestCollectionSpeed:
+    """Tests that collecting the suite stays cheap."""
+
+    def test_collect_under_budget(self):
+        """Test that --collect-only on the fetcher/analyzer tests is fast."""
+        start = time.perf_counter()
+        result = subprocess.run(
+            [
+                sys.executable, "-m", "pytest",
+                "tests/test_risk_analyzer.py",
+                "tests/test_yahoo_finance.py",
+                "--collect-only", "-q", "-p", "no:cacheprovider",
+            ],
+            cwd=_ROOT,
+            capture_output=True,
+            text=True,
+        )
+        elapsed = time.perf_counter() - start
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert elapsed < _COLLECT_BUDGET_SECONDS, (
+            f"Collection took {elapsed:.2f}s "
+            f"(budget {_COLLECT_BUDGET_SECONDS}s)\n{result.stdout}"
+        )
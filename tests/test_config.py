@@ -55,6 +55,20 @@ class TestGetSafeHorizontalLine:
             # Should fallback to ASCII due to LookupError
             assert result == "-"
 
+    def test_utf_encoding_skips_codec_probe(self):
+        """Test that UTF encodings are recognized by name without probing."""
+        with patch('sys.stdout') as mock_stdout, \
+                patch('super_signal.config._horizontal_line_for') as probe:
+            mock_stdout.encoding = 'UTF-8'
+            assert _get_safe_horizontal_line() == "─"
+            probe.assert_not_called()
+
+    def test_returns_unicode_for_box_drawing_code_page(self):
+        """Test that non-UTF code pages with box drawing keep Unicode."""
+        with patch('sys.stdout') as mock_stdout:
+            mock_stdout.encoding = 'cp437'
+            assert _get_safe_horizontal_line() == "─"
+
 
 class TestDisplayConfig:
     """Tests for DisplayConfig class."""
@@ -94,6 +108,12 @@ class TestDisplayConfig:
         assert config.label_width == 25
         assert config.horizontal_line == "*"
 
+    def test_display_config_precomputed_rules(self):
+        """Test that full-width rules are derived from line and width."""
+        config = DisplayConfig(summary_width=12, horizontal_line="*")
+        assert config.horizontal_rule == "*" * 12
+        assert config.separator_rule == "=" * 12
+
     def test_global_display_config_exists(self):
         """Test that global DISPLAY_CONFIG is properly initialized."""
         assert isinstance(DISPLAY_CONFIG, DisplayConfig)
@@ -1,5 +1,7 @@
 """Tests for data models."""
 
+import math
+
 import pytest
 from super_signal.models import StockInfo, RiskFlag, RiskAnalysis, RiskSeverity
 
@@ -52,6 +54,14 @@ class TestStockInfo:
         )
         assert stock.get_headquarters() == "New York, United States"
 
+    def test_repeated_fields_are_interned(self):
+        """Test that low-cardinality fields share one string object."""
+        # Build the values at runtime so they are not compile-time constants
+        first = StockInfo(ticker="A", exchange="".join(["NAS", "DAQ"]))
+        second = StockInfo(ticker="B", exchange="".join(["NASD", "AQ"]))
+        assert first.exchange is second.exchange
+        assert StockInfo(ticker="C").exchange is None
+
     def test_get_display_name_prefers_long_name(self):
         """Test that get_display_name() prefers long_name."""
         stock = StockInfo(
@@ -93,7 +103,7 @@ class TestStockInfo:
         )
         result = stock.percent_off_52week_high()
         assert result is not None
-        assert abs(result - (-10.0)) < 0.01  # -10% off high
+        assert math.isclose(result, -10.0, abs_tol=0.01)  # -10% off high
 
     def test_percent_off_52week_high_handles_at_high(self):
         """Test percent_off_52week_high() when at 52-week high."""
@@ -104,7 +114,7 @@ class TestStockInfo:
         )
         result = stock.percent_off_52week_high()
         assert result is not None
-        assert abs(result) < 0.01  # 0% off high
+        assert math.isclose(result, 0.0, abs_tol=0.01)  # 0% off high
 
     def test_percent_off_52week_high_returns_none_when_missing_data(self):
         """Test percent_off_52week_high() returns None when data missing."""
@@ -123,6 +133,17 @@ class TestStockInfo:
         )
         assert stock.percent_off_52week_high() is None
 
+    @pytest.mark.parametrize("instance", [
+        StockInfo(ticker="TEST"),
+        RiskFlag(flag_type="test", message="Test message"),
+        RiskAnalysis(ticker="TEST"),
+    ], ids=lambda obj: type(obj).__name__)
+    def test_models_use_slots(self, instance):
+        """Test that models store fields in slots rather than a __dict__."""
+        assert not hasattr(instance, "__dict__")
+        with pytest.raises(AttributeError):
+            instance.not_a_field = True
+
 
 class TestRiskFlag:
     """Tests for RiskFlag model."""
@@ -159,6 +180,13 @@ class TestRiskFlag:
         )
         assert str(flag) == "[MEDIUM] Low float"
 
+        flag = RiskFlag(
+            flag_type="adr",
+            message="Minor concern",
+            severity=RiskSeverity.LOW
+        )
+        assert str(flag) == "[LOW] Minor concern"
+
 
 class TestRiskAnalysis:
     """Tests for RiskAnalysis model."""
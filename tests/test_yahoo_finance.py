@@ -1,7 +1,8 @@
 """Tests for Yahoo Finance fetcher module."""
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock, PropertyMock, patch
 import pandas as pd
 from super_signal.fetchers.yahoo_finance import (
     fetch_stock_info,
@@ -12,16 +13,91 @@ from super_signal.fetchers.yahoo_finance import (
 )
 from super_signal.models import StockInfo
 
+# pandas deprecations should be fixed at the call site, not formatted per test
+pytestmark = pytest.mark.filterwarnings("error::FutureWarning")
+
+
+@pytest.fixture(scope="module")
+def empty_series():
+    """Create one empty splits Series for the module; do not mutate it."""
+    return pd.Series(dtype=float)
+
+
+@pytest.fixture
+def make_ticker(empty_series):
+    """Return a factory for yf.Ticker stand-ins with the given info dict.
+
+    The mock has no cash flow data and an empty splits history.
+    """
+    def _make_ticker(info):
+        return SimpleNamespace(info=info, cashflow=None, splits=empty_series)
+    return _make_ticker
+
+
+def _ticker_raising_on(attribute):
+    """Return a yf.Ticker stand-in whose attribute raises when read.
+
+    Returns:
+        Tuple of (ticker, property mock) so tests can check it was read
+    """
+    prop = PropertyMock(side_effect=Exception("Error"))
+    ticker = type("RaisingTicker", (), {attribute: prop})()
+    return ticker, prop
+
+
+@pytest.fixture(scope="module")
+def cf_totalcash_df():
+    """Create one cash flow frame with the canonical operating-cash row."""
+    return pd.DataFrame({
+        '2023-12-31': [1000000, 500000, 200000],
+        '2022-12-31': [900000, 450000, 180000],
+    }, index=['Total Cash From Operating Activities', 'Other1', 'Other2'])
+
+
+# yfinance info payload with every field fetch_stock_info maps; read-only
+_FULL_INFO = MappingProxyType({
+    'longName': 'Test Inc.',
+    'shortName': 'Test',
+    'country': 'United States',
+    'countryOfOrigin': 'USA',
+    'address1': '123 Main St',
+    'city': 'TestCity',
+    'state': 'TS',
+    'zip': '12345',
+    'exchange': 'TEST',
+    'market': 'us_market',
+    'sector': 'Technology',
+    'industry': 'Software',
+    'marketCap': 1000000000,
+    'regularMarketPrice': 50.0,
+    'preMarketPrice': 49.5,
+    'postMarketPrice': 50.5,
+    'fiftyTwoWeekHigh': 60.0,
+    'fiftyTwoWeekLow': 40.0,
+    'averageVolume10days': 1000000,
+    'sharesOutstanding': 10000000,
+    'floatShares': 9000000,
+    'totalDebt': 5000000,
+    'debtToEquity': 0.5,
+    'fullTimeEmployees': 1000,
+    'website': 'https://test.com',
+    'shortPercentOfFloat': 0.05,
+    'shortRatio': 2.5,
+    'heldPercentInsiders': 0.1,
+    'heldPercentInstitutions': 0.6,
+    'lastSplitFactor': '2:1',
+    'lastSplitDate': 1609459200,
+})
+
 
 class TestFetchStockInfo:
     """Tests for fetch_stock_info function."""
 
     @patch('super_signal.fetchers.yahoo_finance.yf.Ticker')
-    def test_fetch_stock_info_success(self, mock_ticker_class):
+    def test_fetch_stock_info_success(self, mock_ticker_class, make_ticker):
         """Test successful stock info fetch."""
         # Setup mock
-        mock_ticker = Mock()
-        mock_ticker.info = {
+        mock_ticker_class.return_value = make_ticker({
             'longName': 'Apple Inc.',
             'shortName': 'Apple',
             'country': 'United States',
@@ -29,10 +105,7 @@ class TestFetchStockInfo:
             'marketCap': 3000000000000,
             'regularMarketPrice': 180.50,
             'floatShares': 16000000000,
-        }
-        mock_ticker.cashflow = None
-        mock_ticker.splits = pd.Series()
-        mock_ticker_class.return_value = mock_ticker
+        })
 
         # Execute
         result = fetch_stock_info('AAPL')
@@ -45,11 +118,9 @@ class TestFetchStockInfo:
         assert result.regular_market_price == 180.50
 
     @patch('super_signal.fetchers.yahoo_finance.yf.Ticker')
-    def test_fetch_stock_info_no_data(self, mock_ticker_class):
+    def test_fetch_stock_info_no_data(self, mock_ticker_class, make_ticker):
         """Test fetch when no data is returned."""
-        mock_ticker = Mock()
-        mock_ticker.info = {}
-        mock_ticker_class.return_value = mock_ticker
+        mock_ticker_class.return_value = make_ticker({})
 
         result = fetch_stock_info('INVALID')
 
@@ -65,16 +136,14 @@ class TestFetchStockInfo:
         assert result is None
 
     @patch('super_signal.fetchers.yahoo_finance.yf.Ticker')
-    def test_fetch_stock_info_uses_price_fallback(self, mock_ticker_class):
+    def test_fetch_stock_info_uses_price_fallback(
+        self, mock_ticker_class, make_ticker
+    ):
         """Test that fetch uses 'price' field as fallback for regularMarketPrice."""
-        mock_ticker = Mock()
-        mock_ticker.info = {
+        mock_ticker_class.return_value = make_ticker({
             'longName': 'Test Company',
             'price': 100.50,  # No regularMarketPrice
-        }
-        mock_ticker.cashflow = None
-        mock_ticker.splits = pd.Series()
-        mock_ticker_class.return_value = mock_ticker
+        })
 
         result = fetch_stock_info('TEST')
 
@@ -82,45 +151,11 @@ class TestFetchStockInfo:
         assert result.regular_market_price == 100.50
 
     @patch('super_signal.fetchers.yahoo_finance.yf.Ticker')
-    def test_fetch_stock_info_includes_all_fields(self, mock_ticker_class):
+    def test_fetch_stock_info_includes_all_fields(
+        self, mock_ticker_class, make_ticker
+    ):
         """Test that fetch_stock_info includes all expected fields."""
-        mock_ticker = Mock()
-        mock_ticker.info = {
-            'longName': 'Test Inc.',
-            'shortName': 'Test',
-            'country': 'United States',
-            'countryOfOrigin': 'USA',
-            'address1': '123 Main St',
-            'city': 'TestCity',
-            'state': 'TS',
-            'zip': '12345',
-            'exchange': 'TEST',
-            'market': 'us_market',
-            'sector': 'Technology',
-            'industry': 'Software',
-            'marketCap': 1000000000,
-            'regularMarketPrice': 50.0,
-            'preMarketPrice': 49.5,
-            'postMarketPrice': 50.5,
-            'fiftyTwoWeekHigh': 60.0,
-            'fiftyTwoWeekLow': 40.0,
-            'averageVolume10days': 1000000,
-            'sharesOutstanding': 10000000,
-            'floatShares': 9000000,
-            'totalDebt': 5000000,
-            'debtToEquity': 0.5,
-            'fullTimeEmployees': 1000,
-            'website': 'https://test.com',
-            'shortPercentOfFloat': 0.05,
-            'shortRatio': 2.5,
-            'heldPercentInsiders': 0.1,
-            'heldPercentInstitutions': 0.6,
-            'lastSplitFactor': '2:1',
-            'lastSplitDate': 1609459200,
-        }
-        mock_ticker.cashflow = None
-        mock_ticker.splits = pd.Series()
-        mock_ticker_class.return_value = mock_ticker
+        mock_ticker_class.return_value = make_ticker(_FULL_INFO)
 
         result = fetch_stock_info('TEST')
 
@@ -199,33 +234,29 @@ class TestIsAdrYahoo:
         # No country means can't determine if foreign
         assert is_adr_yahoo(stock) is False
 
-    def test_is_adr_yahoo_various_us_exchanges(self):
+    @pytest.mark.parametrize(
+        "exchange", ['NYSE', 'NASDAQ', 'AMEX', 'BATS', 'ARCA']
+    )
+    def test_is_adr_yahoo_various_us_exchanges(self, exchange):
         """Test ADR detection on various US exchanges."""
-        for exchange in ['NYSE', 'NASDAQ', 'AMEX', 'BATS', 'ARCA']:
-            stock = StockInfo(
-                ticker='TEST',
-                country='China',
-                exchange=exchange,
-            )
-            assert is_adr_yahoo(stock) is True, f"Failed for exchange {exchange}"
+        stock = StockInfo(
+            ticker='TEST',
+            country='China',
+            exchange=exchange,
+        )
+        assert is_adr_yahoo(stock) is True
 
 
 class TestGetOperatingCashFlow:
     """Tests for get_operating_cash_flow function."""
 
-    def test_get_operating_cash_flow_success(self):
+    def test_get_operating_cash_flow_success(self, cf_totalcash_df):
         """Test successful cash flow retrieval."""
-        # Create actual DataFrame (not mock) for proper pandas behavior
-        cf_data = pd.DataFrame({
-            '2023-12-31': [1000000, 500000, 200000],
-            '2022-12-31': [900000, 450000, 180000],
-        }, index=['Total Cash From Operating Activities', 'Other1', 'Other2'])
-
-        mock_ticker = Mock()
-        mock_ticker.cashflow = cf_data
+        mock_ticker = SimpleNamespace(cashflow=cf_totalcash_df)
 
         result = get_operating_cash_flow(mock_ticker)
 
+        assert type(result) is float
         assert result == 1000000
 
     def test_get_operating_cash_flow_alternative_field_name(self):
@@ -236,17 +267,16 @@ class TestGetOperatingCashFlow:
             '2022-12-31': [1800000, 450000],
         }, index=['totalCashFromOperatingActivities', 'Other'])
 
-        mock_ticker = Mock()
-        mock_ticker.cashflow = cf_data
+        mock_ticker = SimpleNamespace(cashflow=cf_data)
 
         result = get_operating_cash_flow(mock_ticker)
 
+        assert type(result) is float
         assert result == 2000000
 
     def test_get_operating_cash_flow_no_data(self):
         """Test when cash flow data is unavailable."""
-        mock_ticker = Mock()
-        mock_ticker.cashflow = None
+        mock_ticker = SimpleNamespace(cashflow=None)
 
         result = get_operating_cash_flow(mock_ticker)
 
@@ -254,8 +284,7 @@ class TestGetOperatingCashFlow:
 
     def test_get_operating_cash_flow_empty_dataframe(self):
         """Test when cash flow dataframe is empty."""
-        mock_ticker = Mock()
-        mock_ticker.cashflow = pd.DataFrame()
+        mock_ticker = SimpleNamespace(cashflow=pd.DataFrame())
 
         result = get_operating_cash_flow(mock_ticker)
 
@@ -263,11 +292,10 @@ class TestGetOperatingCashFlow:
 
     def test_get_operating_cash_flow_field_not_found(self):
         """Test when operating cash flow field is not in data."""
-        mock_ticker = Mock()
         cf_data = pd.DataFrame({
             0: [500000],
         }, index=['Some Other Field'])
-        mock_ticker.cashflow = cf_data
+        mock_ticker = SimpleNamespace(cashflow=cf_data)
 
         result = get_operating_cash_flow(mock_ticker)
 
@@ -275,58 +303,36 @@ class TestGetOperatingCashFlow:
 
     def test_get_operating_cash_flow_exception(self):
         """Test that exceptions are handled gracefully."""
-        mock_ticker = Mock()
-        mock_ticker.cashflow = Mock(side_effect=Exception("Error"))
+        mock_ticker, cashflow = _ticker_raising_on("cashflow")
 
         result = get_operating_cash_flow(mock_ticker)
 
         assert result is None
+        cashflow.assert_called_once_with()
 
 
 class TestInterpretSplitFactor:
     """Tests for interpret_split_factor function."""
 
-    def test_interpret_split_factor_forward_split(self):
-        """Test interpreting a forward split (2:1)."""
-        result = interpret_split_factor("2:1")
-        assert result == "2:1, split"
-
-    def test_interpret_split_factor_reverse_split(self):
-        """Test interpreting a reverse split (1:10)."""
-        result = interpret_split_factor("1:10")
-        assert result == "1:10, reverse split"
-
-    def test_interpret_split_factor_from_ratio_forward(self):
-        """Test interpreting split from ratio float (forward split)."""
-        result = interpret_split_factor(None, 2.0)
-        assert result == "2:1, split"
-
-    def test_interpret_split_factor_from_ratio_reverse(self):
-        """Test interpreting split from ratio float (reverse split)."""
-        result = interpret_split_factor(None, 0.5)
-        assert result == "1:2, reverse split"
-
-    def test_interpret_split_factor_invalid_string(self):
-        """Test with invalid split factor string."""
-        result = interpret_split_factor("invalid")
-        assert result == ""
-
-    def test_interpret_split_factor_no_data(self):
-        """Test with no split data."""
-        result = interpret_split_factor(None, None)
-        assert result == ""
-
-    def test_interpret_split_factor_zero_ratio(self):
-        """Test with zero ratio."""
-        result = interpret_split_factor(None, 0.0)
-        assert result == ""
-
-    def test_interpret_split_factor_various_ratios(self):
-        """Test various split ratios."""
-        assert "3:1, split" == interpret_split_factor("3:1")
-        assert "1:5, reverse split" == interpret_split_factor("1:5")
-        assert "4:1, split" == interpret_split_factor(None, 4.0)
-        assert "1:3, reverse split" == interpret_split_factor(None, 0.333)
+    @pytest.mark.parametrize("factor, ratio, expected", [
+        # From factor string
+        ("2:1", None, "2:1, split"),
+        ("1:10", None, "1:10, reverse split"),
+        ("3:1", None, "3:1, split"),
+        ("1:5", None, "1:5, reverse split"),
+        # From ratio float
+        (None, 2.0, "2:1, split"),
+        (None, 0.5, "1:2, reverse split"),
+        (None, 4.0, "4:1, split"),
+        (None, 0.333, "1:3, reverse split"),
+        # Unusable input
+        ("invalid", None, ""),
+        (None, None, ""),
+        (None, 0.0, ""),
+    ])
+    def test_interpret_split_factor(self, factor, ratio, expected):
+        """Test split descriptions from factor strings and ratio floats."""
+        assert interpret_split_factor(factor, ratio) == expected
 
 
 class TestGetLastSplitDetails:
@@ -334,8 +340,8 @@ class TestGetLastSplitDetails:
 
     def test_get_last_split_details_from_info(self):
         """Test getting split details from info dict."""
-        mock_ticker = Mock()
-        mock_ticker.splits = pd.Series()
+        # A parseable lastSplitFactor means ticker.splits is never consulted
+        mock_ticker = SimpleNamespace()
 
         info = {
             'lastSplitFactor': '2:1',
@@ -349,8 +355,7 @@ class TestGetLastSplitDetails:
 
     def test_get_last_split_details_no_date(self):
         """Test split details when date is missing."""
-        mock_ticker = Mock()
-        mock_ticker.splits = pd.Series()
+        mock_ticker = SimpleNamespace()
 
         info = {
             'lastSplitFactor': '2:1',
@@ -362,12 +367,11 @@ class TestGetLastSplitDetails:
 
     def test_get_last_split_details_from_ticker_splits(self):
         """Test getting split details from ticker splits history."""
-        mock_ticker = Mock()
         split_data = pd.Series(
             [2.0],
             index=[pd.Timestamp('2022-06-15')]
         )
-        mock_ticker.splits = split_data
+        mock_ticker = SimpleNamespace(splits=split_data)
 
         info = {}
 
@@ -376,10 +380,9 @@ class TestGetLastSplitDetails:
         assert '2022-06-15' in result
         assert 'split' in result
 
-    def test_get_last_split_details_no_data(self):
+    def test_get_last_split_details_no_data(self, empty_series):
         """Test when no split data is available."""
-        mock_ticker = Mock()
-        mock_ticker.splits = pd.Series()
+        mock_ticker = SimpleNamespace(splits=empty_series)
 
         info = {}
 
@@ -389,14 +392,14 @@ class TestGetLastSplitDetails:
 
     def test_get_last_split_details_exception(self):
         """Test that exceptions return empty string."""
-        mock_ticker = Mock()
-        mock_ticker.splits = Mock(side_effect=Exception("Error"))
+        mock_ticker, splits = _ticker_raising_on("splits")
 
         info = {}
 
         result = get_last_split_details(mock_ticker, info)
 
         assert result == ""
+        splits.assert_called_once_with()
 
 
 class TestYahooFinanceEdgeCases:
@@ -427,16 +430,14 @@ class TestYahooFinanceEdgeCases:
         assert is_adr_yahoo(stock) is True
 
     @patch('super_signal.fetchers.yahoo_finance.yf.Ticker')
-    def test_fetch_handles_missing_optional_fields(self, mock_ticker_class):
+    def test_fetch_handles_missing_optional_fields(
+        self, mock_ticker_class, make_ticker
+    ):
         """Test that fetch handles missing optional fields."""
-        mock_ticker = Mock()
-        mock_ticker.info = {
+        mock_ticker_class.return_value = make_ticker({
             'longName': 'Minimal Company',
             # Most fields missing
-        }
-        mock_ticker.cashflow = None
-        mock_ticker.splits = pd.Series()
-        mock_ticker_class.return_value = mock_ticker
+        })
 
         result = fetch_stock_info('MIN')
 